@@ -7,15 +7,21 @@ Railway-compatible version with proper imports
 
 import json
 import os
+import re
 import asyncio
 import time
 import threading
-from datetime import datetime, timedelta
+import contextlib
+import queue
+import functools
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional
+from collections import Counter, deque
+import itertools
 import csv
-import pandas as pd
+import atexit
+import sqlite3
 from pathlib import Path
-import uuid
 
 # Fixed imports for Railway deployment
 try:
@@ -41,147 +47,445 @@ except ImportError as e:
     
     llm_manager = FallbackLLMManager()
 
+_VIRAL_HASHTAGS = ("#PokemonTCG", "#Trading", "#TradeUp")
+_FALLBACK_POST = {
+    "content": "Pokemon TCG collecting tips! What's your favorite card? Trade safely on TradeUp!",
+    "engagement_score": 0.7,
+    "mentions_tradeup": True
+}
+
 def generate_viral_content(count: int = 1, topic: str = None) -> List[Dict[str, Any]]:
     """Generate viral content wrapper function"""
+    generated_at = datetime.now().isoformat()  # One timestamp for the whole batch
     try:
         # Use your existing content generator
         content_list = generate_content_main(count=count, topic=topic)
         
         viral_posts = []
-        for i, content in enumerate(content_list):
+        for content in content_list:
             viral_posts.append({
                 "content": content,
                 "engagement_score": 0.75,
                 "topic": topic or "general",
-                "generated_at": datetime.now().isoformat(),
-                "hashtags": ["#PokemonTCG", "#Trading", "#TradeUp"],
+                "generated_at": generated_at,
+                "hashtags": list(_VIRAL_HASHTAGS),
                 "mentions_tradeup": "TradeUp" in content
             })
         
         return viral_posts
     except Exception as e:
         print(f"Error generating viral content: {e}")
-        return [{
-            "content": "Pokemon TCG collecting tips! What's your favorite card? Trade safely on TradeUp!",
-            "engagement_score": 0.7,
-            "topic": topic or "general",
-            "generated_at": datetime.now().isoformat(),
-            "hashtags": ["#PokemonTCG", "#Trading", "#TradeUp"],
-            "mentions_tradeup": True
-        }] * count
+        # Separate dicts per post; callers add ids and approval state to each one
+        return [
+            {**_FALLBACK_POST, "topic": topic or "general", "generated_at": generated_at, "hashtags": list(_VIRAL_HASHTAGS)}
+            for _ in range(count)
+        ]
+
+_TRADEUP_RE = re.compile(r"tradeup", re.IGNORECASE)
+_TRADEUP_SUFFIX = " Trade safely on TradeUp!"
 
 def optimize_content_for_engagement(content: str) -> str:
     """Optimize content for better engagement"""
     try:
-        # Add TradeUp mention if not present (20% chance)
-        if "TradeUp" not in content and "tradeup" not in content.lower():
-            if content.endswith("!") or content.endswith("."):
-                content = content[:-1] + " Trade safely on TradeUp!"
-            else:
-                content += " Trade safely on TradeUp!"
+        # Add TradeUp mention if not present
+        if _TRADEUP_RE.search(content):
+            return content
         
-        return content
+        return (content[:-1] + _TRADEUP_SUFFIX) if content[-1:] in ("!", ".") else content + _TRADEUP_SUFFIX
     except Exception as e:
         print(f"Error optimizing content: {e}")
         return content
 
+# orjson is several times faster than the stdlib json module; fall back if it isn't installed
+try:
+    import orjson
+    
+    def _json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
+    
+    _json_loads = json.loads
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    return _json_dumps_bytes(obj, indent=indent).decode()
+
+# Static trending topics served by get_topics
+_TOPICS = (
+    {"name": "Charizard", "count": 89, "trend": "up", "percentage": 28},
+    {"name": "Pikachu", "count": 76, "trend": "up", "percentage": 24},
+    {"name": "Booster Packs", "count": 65, "trend": "stable", "percentage": 20},
+    {"name": "Tournament", "count": 45, "trend": "up", "percentage": 14},
+    {"name": "Trading", "count": 32, "trend": "down", "percentage": 10},
+    {"name": "Collection", "count": 13, "trend": "stable", "percentage": 4}
+)
+
+@functools.lru_cache(maxsize=32)
+def _engagement_series(days: int, today: int) -> List[Dict[str, Any]]:
+    """Engagement chart data, cached per (days, date) so it rebuilds once a day"""
+    data = []
+    for i in range(days):
+        data.append({
+            "date": date.fromordinal(today - i).isoformat(),
+            "engagement": round(5 + (i * 0.5), 1),
+            "posts": 10 + i
+        })
+    return list(reversed(data))
+
+# Defaults never change, so serialize them once and copy by re-parsing when needed
+_DEFAULT_STATUS_BYTES = _json_dumps_bytes({
+    "running": False,
+    "uptime": None,
+    "lastRun": None,
+    "stats": {
+        "postsToday": 0,
+        "repliesToday": 0,
+        "successRate": 100
+    }
+})
+
+_DEFAULT_SETTINGS_BYTES = _json_dumps_bytes({
+    "postsPerDay": 12,
+    "keywords": ["Pokemon", "TCG", "Charizard", "Pikachu"],
+    "engagementMode": "balanced",
+    "autoReply": True,
+    "contentTypes": {
+        "cardPulls": True,
+        "deckBuilding": True,
+        "marketAnalysis": True,
+        "tournaments": True
+    }
+})
+
+# CSV export columns as (header, generated post key, default)
+_EXPORT_CSV_COLUMNS = (
+    ("id", "id", ""),
+    ("content", "content", ""),
+    ("topic", "topic", ""),
+    ("approved", "approved", ""),
+    ("scheduled_time", "scheduledTime", ""),
+    ("engagement_score", "engagement_score", ""),
+    ("created_at", "created_at", ""),
+    ("approved_at", "approved_at", ""),
+    ("scheduled", "scheduled", False),
+)
+
+def _success_percent(successes: int, attempts: int) -> int:
+    """Successes as a whole percentage of attempts; 100 before any attempt"""
+    return round(100 * successes / attempts) if attempts else 100
+
+JOB_STATS_FLUSH_SECONDS = 5  # How often buffered job stats are written to jobs.db
+GENERATED_POSTS_COMPACT_EVERY = 200  # Rewrite the generated posts snapshot after this many log events
+METRICS_RECONCILE_SECONDS = 300  # How often the post totals rollup is recounted from the posts table
+RECENT_POSTS_CACHE_SIZE = 500  # Newest posts kept in memory to serve get_posts pages
+
 class BotManager:
     def __init__(self):
         # Use Railway-compatible data directory
         self.data_dir = Path("data")
         self.data_dir.mkdir(exist_ok=True)
         
-        self.jobs_file = self.data_dir / "bot_jobs.json"
+        self.jobs_file = self.data_dir / "bot_jobs.json"  # Legacy store, migrated into jobs.db
+        self.jobs_db_file = self.data_dir / "jobs.db"
         self.status_file = self.data_dir / "bot_status.json"
         self.settings_file = self.data_dir / "settings.json"
         self.generated_posts_file = self.data_dir / "generated_posts.json"  # New file for approval workflow
+        self.generated_posts_log = self.data_dir / "generated_posts.log"  # Changes since the last snapshot
+        self.posts_file = self.data_dir / "posts.csv"  # Legacy store, migrated into jobs.db
         
-        self.running_jobs = {}  # Track running job threads
+        self.running_jobs = {}  # Track running job tasks
         self.generated_posts = []  # In-memory storage for generated posts
         
+        # Generated post changes are appended to a log and folded into the snapshot periodically
+        self._posts_by_id: Dict[str, Dict[str, Any]] = {}
+        self._posts_log_lock = threading.RLock()
+        self._posts_log_fp = None
+        self._posts_log_events = 0
+        self._posts_log_buffer: Optional[List[str]] = None  # Set while a batch of events is being collected
+        self._approval_counts: Counter = Counter()  # Generated posts by "approved" value (True/False/None)
+        self._scheduled_count = 0
+        self._last_generated_at: Optional[str] = None
+        
+        # Jobs are stored one row per job so updates don't rewrite the whole store
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(self.jobs_db_file, isolation_level=None, check_same_thread=False)
+        
+        # Parsed jobs are served from memory and written through to jobs.db on change
+        self._jobs_cache: Dict[str, Dict[str, Any]] = {}
+        self._jobs_lock = threading.RLock()
+        self._jobs_data_version = None  # PRAGMA data_version when the cache was loaded
+        
+        # Stats changes only touch the cache; a background task persists them in batches
+        self._dirty_jobs: set = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Posted tweets are queued and inserted in batches by the flush loop
+        self._posts_queue: queue.SimpleQueue = queue.SimpleQueue()
+        atexit.register(self._flush_posts_queue)
+        
+        # Running post totals so get_metrics doesn't aggregate the posts table per request
+        self._post_totals = {"totalPosts": 0, "totalLikes": 0, "totalEngagement": 0}
+        
+        # Newest posts first; get_posts only queries the table for pages past the end of this
+        self._recent_posts: deque = deque(maxlen=RECENT_POSTS_CACHE_SIZE)
+        
+        # Parsed bot_status.json, keyed by the file's mtime and size when it was read
+        self._status_cache: Optional[tuple] = None
+        atexit.register(self._flush_dirty_jobs)
+        
         # Initialize data files
         self._initialize_files()
     
     def _initialize_files(self):
         """Initialize data files if they don't exist"""
-        if not self.jobs_file.exists():
-            with open(self.jobs_file, 'w') as f:
-                json.dump([], f)
+        with self._db_lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("PRAGMA mmap_size=268435456")
+            self._db.execute("CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, data TEXT)")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS posts (id TEXT PRIMARY KEY, content TEXT, likes INTEGER, "
+                "retweets INTEGER, replies INTEGER, topics TEXT, timestamp TEXT)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_posts_ts ON posts (timestamp DESC)")
+        
+        self._migrate_legacy_jobs()
+        self._migrate_legacy_posts()
+        self._reconcile_post_totals()
+        
+        # Load jobs once; all reads after this are served from the cache
+        self._load_jobs_cache()
         
         if not self.status_file.exists():
-            with open(self.status_file, 'w') as f:
-                json.dump({
-                    "running": False,
-                    "uptime": None,
-                    "lastRun": None,
-                    "stats": {
-                        "postsToday": 0,
-                        "repliesToday": 0,
-                        "successRate": 100
-                    }
-                }, f)
+            self._atomic_write_bytes(self.status_file, _DEFAULT_STATUS_BYTES)
         
         if not self.settings_file.exists():
-            with open(self.settings_file, 'w') as f:
-                json.dump({
-                    "postsPerDay": 12,
-                    "keywords": ["Pokemon", "TCG", "Charizard", "Pikachu"],
-                    "engagementMode": "balanced",
-                    "autoReply": True,
-                    "contentTypes": {
-                        "cardPulls": True,
-                        "deckBuilding": True,
-                        "marketAnalysis": True,
-                        "tournaments": True
-                    }
-                }, f)
+            self._atomic_write_bytes(self.settings_file, _DEFAULT_SETTINGS_BYTES)
         
         # Initialize generated posts file
         if not self.generated_posts_file.exists():
-            with open(self.generated_posts_file, 'w') as f:
-                json.dump([], f)
+            self._atomic_write_json(self.generated_posts_file, [])
         
         # Load existing generated posts
         try:
-            with open(self.generated_posts_file, 'r') as f:
-                self.generated_posts = json.load(f)
+            self.generated_posts = self._read_json(self.generated_posts_file)
         except:
             self.generated_posts = []
+        self._posts_by_id = {post["id"]: post for post in self.generated_posts if "id" in post}
+        
+        self._replay_generated_posts_log()
+        self._reindex_generated_posts()
+        self._posts_log_fp = open(self.generated_posts_log, 'a', buffering=1, encoding='utf-8')
+        atexit.register(self._compact_generated_posts)
+    
+    def _replay_generated_posts_log(self):
+        """Apply changes logged since the last snapshot, then fold them into it"""
+        if not self.generated_posts_log.exists():
+            return
+        
+        replayed = 0
+        with open(self.generated_posts_log, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = _json_loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-write; everything before it is intact
+                    continue
+                
+                if event.get("op") == "add":
+                    post = event["post"]
+                    existing = self._posts_by_id.get(post.get("id"))
+                    if existing is not None:
+                        existing.update(post)
+                    else:
+                        self.generated_posts.append(post)
+                        self._posts_by_id[post["id"]] = post
+                elif event.get("op") == "update":
+                    post = self._posts_by_id.get(event.get("id"))
+                    if post is not None:
+                        post.update(event.get("fields", {}))
+                replayed += 1
+        
+        if replayed:
+            print(f"✅ Replayed {replayed} generated post changes")
+            self._compact_generated_posts(force=True)
+    
+    def _log_generated_post_event(self, event: Dict[str, Any]):
+        """Append one change to the generated posts log"""
+        with self._posts_log_lock:
+            line = _json_dumps(event) + "\n"
+            if self._posts_log_buffer is not None:
+                self._posts_log_buffer.append(line)
+                return
+            self._write_generated_posts_log(line, 1)
+    
+    def _write_generated_posts_log(self, data: str, events: int):
+        """Write logged events and compact once enough have accumulated"""
+        self._posts_log_fp.write(data)
+        self._posts_log_events += events
+        if self._posts_log_events >= GENERATED_POSTS_COMPACT_EVERY:
+            self._compact_generated_posts()
+    
+    @contextlib.contextmanager
+    def _batched_post_log(self):
+        """Collect the generated post changes made inside the block into a single append"""
+        with self._posts_log_lock:
+            if self._posts_log_buffer is not None:
+                # Already batching; the outer block does the write
+                yield
+                return
+            
+            self._posts_log_buffer = []
+            try:
+                yield
+            finally:
+                lines, self._posts_log_buffer = self._posts_log_buffer, None
+                if lines:
+                    self._write_generated_posts_log("".join(lines), len(lines))
+    
+    def _reindex_generated_posts(self):
+        """Rebuild the id index and workflow counters from the generated posts list"""
+        posts_by_id = {}
+        approval_counts = Counter()
+        scheduled = 0
+        last_generated = None
+        
+        # One pass over the list; created_at is ISO formatted so string order is time order
+        for post in self.generated_posts:
+            if "id" in post:
+                posts_by_id[post["id"]] = post
+            approval_counts[post.get("approved")] += 1
+            if post.get("scheduled") is True:
+                scheduled += 1
+            created_at = post.get("created_at", "")
+            if last_generated is None or created_at > last_generated:
+                last_generated = created_at
+        
+        self._posts_by_id = posts_by_id
+        self._approval_counts = approval_counts
+        self._scheduled_count = scheduled
+        self._last_generated_at = last_generated
+    
+    def _update_generated_post(self, post: Dict[str, Any], fields: Dict[str, Any]):
+        """Apply fields to a generated post and log the change"""
+        if "approved" in fields:
+            self._approval_counts[post.get("approved")] -= 1
+            self._approval_counts[fields["approved"]] += 1
+        if "scheduled" in fields:
+            self._scheduled_count += (fields["scheduled"] is True) - (post.get("scheduled") is True)
+        post.update(fields)
+        self._log_generated_post_event({"op": "update", "id": post["id"], "fields": fields})
+    
+    def _compact_generated_posts(self, force: bool = False):
+        """Write a full generated posts snapshot and truncate the change log"""
+        with self._posts_log_lock:
+            if not force and not self._posts_log_events:
+                return
+            try:
+                self._atomic_write_json(self.generated_posts_file, self.generated_posts)
+                
+                # Only truncate once the snapshot is safely on disk
+                if self._posts_log_fp is not None:
+                    self._posts_log_fp.close()
+                    self._posts_log_fp = open(self.generated_posts_log, 'w', buffering=1, encoding='utf-8')
+                else:
+                    self.generated_posts_log.write_text("")
+                self._posts_log_events = 0
+            except Exception as e:
+                print(f"❌ Error compacting generated posts: {e}")
+    
+    @staticmethod
+    def _atomic_write_bytes(path: Path, data: bytes):
+        """Write data to a temp file and rename it over path, so readers never see a partial file"""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def _read_json(path: Path) -> Any:
+        """Parse a JSON file"""
+        return _json_loads(path.read_bytes())
+    
+    def _atomic_write_json(self, path: Path, obj: Any, indent: bool = False):
+        """Atomically replace path with obj serialized as JSON"""
+        self._atomic_write_bytes(path, _json_dumps_bytes(obj, indent=indent))
+    
+    def _migrate_legacy_jobs(self):
+        """Import jobs from the old bot_jobs.json file into the jobs table"""
+        if not self.jobs_file.exists():
+            return
+        
+        try:
+            jobs = self._read_json(self.jobs_file)
+            
+            with self._db_transaction():
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO jobs (id, data) VALUES (?, json(?))",
+                    [(job["id"], _json_dumps(job)) for job in jobs if "id" in job]
+                )
+            
+            # Keep the old file around but make sure it's only imported once
+            self.jobs_file.rename(self.jobs_file.with_suffix(".json.migrated"))
+            print(f"✅ Migrated {len(jobs)} jobs to {self.jobs_db_file}")
+        except Exception as e:
+            print(f"❌ Error migrating legacy jobs: {e}")
+    
+    def _migrate_legacy_posts(self):
+        """Import posts.csv into the posts table once"""
+        if not self.posts_file.exists():
+            return
+        
+        try:
+            default_timestamp = datetime.now().isoformat()
+            with open(self.posts_file, 'r', newline='', encoding='utf-8') as f:
+                rows = [
+                    (row.get('id'), row.get('content', ""), int(row.get('likes') or 0),
+                     int(row.get('retweets') or 0), int(row.get('replies') or 0),
+                     row.get('topics') or "[]", row.get('timestamp') or default_timestamp)
+                    for row in csv.DictReader(f)
+                ]
+            
+            with self._db_transaction():
+                self._db.executemany("INSERT OR IGNORE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            
+            self.posts_file.rename(self.posts_file.with_suffix(".csv.migrated"))
+            print(f"✅ Migrated {len(rows)} posts to {self.jobs_db_file}")
+        except Exception as e:
+            print(f"❌ Error migrating legacy posts: {e}")
     
     def create_job(self, job_type: str, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new bot job"""
-        job_id = f"{job_type}-{int(datetime.now().timestamp())}"
+        now = time.time()
+        job_id = f"{job_type}-{int(now)}"
         
         new_job = {
             "id": job_id,
             "type": job_type,
             "status": "stopped",
             "settings": settings,
-            "createdAt": datetime.now().isoformat(),
+            "createdAt": datetime.fromtimestamp(now).isoformat(),
             "lastRun": None,
             "nextRun": None,
             "stats": {
                 "postsToday": 0,
                 "repliesToday": 0,
-                "successRate": 100
+                "successes": 0,
+                "attempts": 0
             }
         }
         
-        # Load existing jobs
-        try:
-            with open(self.jobs_file, 'r') as f:
-                jobs = json.load(f)
-        except:
-            jobs = []
-        
-        # Add new job
-        jobs.append(new_job)
+        # Save job
+        with self._jobs_lock:
+            self._jobs_cache[job_id] = new_job
+            self._save_job(new_job)
         
-        # Save jobs
-        with open(self.jobs_file, 'w') as f:
-            json.dump(jobs, f, indent=2)
-        
-        return new_job
+        return self._job_snapshot(new_job)
     
     def create_job_with_approval(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Create a job that will use the approval workflow"""
@@ -197,17 +501,28 @@ class BotManager:
     def store_generated_posts(self, posts: List[Dict[str, Any]], settings: Dict[str, Any]) -> bool:
         """Store generated posts for the approval workflow"""
         try:
-            # Add metadata to each post
-            for post in posts:
-                post["created_at"] = datetime.now().isoformat()
-                post["workflow_id"] = f"workflow-{int(datetime.now().timestamp())}"
+            # Add metadata to each post; the whole batch shares one timestamp
+            now = datetime.now()
+            created_at = now.isoformat()
+            workflow_id = f"workflow-{int(now.timestamp())}"
+            for i, post in enumerate(posts):
+                post["created_at"] = created_at
+                post["workflow_id"] = workflow_id
+                post.setdefault("id", f"{workflow_id}-{i}")
             
             # Store in memory
             self.generated_posts.extend(posts)
+            with self._batched_post_log():
+                for post in posts:
+                    self._posts_by_id[post["id"]] = post
+                    self._approval_counts[post.get("approved")] += 1
+                    self._scheduled_count += post.get("scheduled") is True
+                    
+                    # Also log for persistence
+                    self._log_generated_post_event({"op": "add", "post": post})
             
-            # Also save to file for persistence
-            with open(self.generated_posts_file, 'w') as f:
-                json.dump(self.generated_posts, f, indent=2)
+            if posts:
+                self._last_generated_at = max(self._last_generated_at or "", created_at)
             
             print(f"✅ Stored {len(posts)} generated posts for approval")
             return True
@@ -228,20 +543,18 @@ class BotManager:
             print(f"Error getting generated posts: {e}")
             return []
     
-    def approve_post(self, post_id: str) -> bool:
+    def approve_post(self, post_id: str, approved_at: Optional[str] = None) -> bool:
         """Approve a generated post"""
         try:
-            for post in self.generated_posts:
-                if post.get("id") == post_id:
-                    post["approved"] = True
-                    post["approved_at"] = datetime.now().isoformat()
-                    
-                    # Save updated posts
-                    with open(self.generated_posts_file, 'w') as f:
-                        json.dump(self.generated_posts, f, indent=2)
-                    
-                    print(f"✅ Approved post: {post_id}")
-                    return True
+            post = self._posts_by_id.get(post_id)
+            if post is not None:
+                self._update_generated_post(post, {
+                    "approved": True,
+                    "approved_at": approved_at or datetime.now().isoformat()
+                })
+                
+                print(f"✅ Approved post: {post_id}")
+                return True
             
             print(f"❌ Post not found for approval: {post_id}")
             return False
@@ -249,20 +562,18 @@ class BotManager:
             print(f"❌ Error approving post: {e}")
             return False
     
-    def reject_post(self, post_id: str) -> bool:
+    def reject_post(self, post_id: str, rejected_at: Optional[str] = None) -> bool:
         """Reject a generated post"""
         try:
-            for post in self.generated_posts:
-                if post.get("id") == post_id:
-                    post["approved"] = False
-                    post["rejected_at"] = datetime.now().isoformat()
-                    
-                    # Save updated posts
-                    with open(self.generated_posts_file, 'w') as f:
-                        json.dump(self.generated_posts, f, indent=2)
-                    
-                    print(f"✅ Rejected post: {post_id}")
-                    return True
+            post = self._posts_by_id.get(post_id)
+            if post is not None:
+                self._update_generated_post(post, {
+                    "approved": False,
+                    "rejected_at": rejected_at or datetime.now().isoformat()
+                })
+                
+                print(f"✅ Rejected post: {post_id}")
+                return True
             
             print(f"❌ Post not found for rejection: {post_id}")
             return False
@@ -296,14 +607,14 @@ class BotManager:
             job = self.create_job("posting", settings)
             
             # Mark posts as scheduled
-            for post in approved_posts:
-                post["scheduled"] = True
-                post["job_id"] = job["id"]
-                post["scheduled_at"] = datetime.now().isoformat()
-            
-            # Save updated posts
-            with open(self.generated_posts_file, 'w') as f:
-                json.dump(self.generated_posts, f, indent=2)
+            scheduled_at = datetime.now().isoformat()
+            with self._batched_post_log():
+                for post in approved_posts:
+                    self._update_generated_post(post, {
+                        "scheduled": True,
+                        "job_id": job["id"],
+                        "scheduled_at": scheduled_at
+                    })
             
             print(f"✅ Scheduled {len(approved_posts)} approved posts as job {job['id']}")
             
@@ -318,46 +629,171 @@ class BotManager:
             print(f"❌ Error scheduling approved posts: {e}")
             return {"scheduled_count": 0, "error": str(e)}
     
+    def _save_job(self, job: Dict[str, Any]):
+        """Write a single job row through to jobs.db"""
+        self._save_jobs([job])
+    
+    @contextlib.contextmanager
+    def _db_transaction(self):
+        """Hold the db lock and run the block in one explicit transaction"""
+        # The connection is in autocommit mode, where "with self._db" opens no transaction
+        with self._db_lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+    
+    def _save_jobs(self, jobs: List[Dict[str, Any]]):
+        """Write several job rows to jobs.db in one transaction"""
+        with self._db_transaction():
+            self._db.executemany(
+                "INSERT INTO jobs (id, data) VALUES (?, json(?)) "
+                "ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+                [(job["id"], _json_dumps(job)) for job in jobs]
+            )
+    
+    def _load_jobs_cache(self):
+        """(Re)load all jobs from jobs.db into the cache"""
+        with self._jobs_lock:
+            with self._db_lock:
+                self._jobs_data_version = self._db.execute("PRAGMA data_version").fetchone()[0]
+                rows = self._db.execute("SELECT id, data FROM jobs ORDER BY rowid").fetchall()
+            self._jobs_cache = {job_id: _json_loads(data) for job_id, data in rows}
+    
+    def _refresh_jobs_cache(self):
+        """Reload the cache if another process has committed to jobs.db since it was loaded"""
+        with self._jobs_lock:
+            with self._db_lock:
+                data_version = self._db.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._jobs_data_version:
+                # Keep our own pending stats before picking up the other writer's changes
+                self._flush_dirty_jobs()
+                self._load_jobs_cache()
+    
+    @staticmethod
+    def _job_snapshot(job: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a cached job that callers can hold or change without touching the cache"""
+        # Stats are the only part mutated in place; settings are replaced wholesale on update
+        stats = dict(job.get("stats", {}))
+        stats["successRate"] = _success_percent(stats.get("successes", 0), stats.get("attempts", 0))
+        return dict(job, stats=stats)
+    
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific job by ID"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                jobs = json.load(f)
-            
-            for job in jobs:
-                if job["id"] == job_id:
-                    return job
-        except:
-            pass
-        
-        return None
+        with self._jobs_lock:
+            self._refresh_jobs_cache()
+            job = self._jobs_cache.get(job_id)
+            return self._job_snapshot(job) if job is not None else None
     
     def get_all_jobs(self) -> List[Dict[str, Any]]:
         """Get all jobs"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                return json.load(f)
-        except:
-            return []
+        with self._jobs_lock:
+            self._refresh_jobs_cache()
+            return [self._job_snapshot(job) for job in self._jobs_cache.values()]
     
     def update_job(self, job_id: str, updated_job: Dict[str, Any]) -> Dict[str, Any]:
         """Update a job"""
         try:
-            with open(self.jobs_file, 'r') as f:
-                jobs = json.load(f)
-            
-            for i, job in enumerate(jobs):
-                if job["id"] == job_id:
-                    jobs[i] = updated_job
-                    break
-            
-            with open(self.jobs_file, 'w') as f:
-                json.dump(jobs, f, indent=2)
+            with self._jobs_lock:
+                if job_id in self._jobs_cache:
+                    self._jobs_cache[job_id] = self._job_snapshot(updated_job)
+                    self._save_job(updated_job)
+                    self._dirty_jobs.discard(job_id)
         except Exception as e:
             print(f"Error updating job: {e}")
         
         return updated_job
     
+    def _update_job_inplace(self, job_id: str, mutator, persist: bool = True) -> Optional[Dict[str, Any]]:
+        """Apply mutator to a cached job; with persist=False its stats are left to the flush task"""
+        with self._jobs_lock:
+            job = self._jobs_cache.get(job_id)
+            if job is None:
+                return None
+            mutator(job)
+            if persist:
+                self._save_job(job)
+                self._dirty_jobs.discard(job_id)
+            else:
+                self._dirty_jobs.add(job_id)
+            return job
+    
+    def _flush_dirty_jobs(self):
+        """Persist stats of jobs changed since the last flush"""
+        try:
+            with self._jobs_lock:
+                rows = [
+                    (_json_dumps(self._jobs_cache[job_id].get("stats", {})), job_id)
+                    for job_id in self._dirty_jobs if job_id in self._jobs_cache
+                ]
+                self._dirty_jobs.clear()
+                if rows:
+                    # Patch just the stats subtree in SQL rather than rewriting the whole job document
+                    with self._db_transaction():
+                        self._db.executemany(
+                            "UPDATE jobs SET data = json_set(data, '$.stats', json(?)) WHERE id = ?", rows
+                        )
+        except Exception as e:
+            print(f"❌ Error flushing job stats: {e}")
+    
+    async def _flush_loop(self):
+        """Flush buffered job stats every few seconds and periodically recount post totals"""
+        last_reconcile = time.monotonic()
+        try:
+            while True:
+                await asyncio.sleep(JOB_STATS_FLUSH_SECONDS)
+                self._flush_dirty_jobs()
+                self._flush_posts_queue()
+                
+                if time.monotonic() - last_reconcile >= METRICS_RECONCILE_SECONDS:
+                    self._reconcile_post_totals()
+                    last_reconcile = time.monotonic()
+        finally:
+            self._flush_dirty_jobs()
+            self._flush_posts_queue()
+    
+    def _reconcile_post_totals(self):
+        """Recount the post totals rollup from the posts table"""
+        self._flush_posts_queue()
+        try:
+            with self._db_lock:
+                total_posts, total_likes, total_engagement = self._db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(likes), 0), COALESCE(SUM(likes + retweets + replies), 0) FROM posts"
+                ).fetchone()
+                self._post_totals = {
+                    "totalPosts": total_posts,
+                    "totalLikes": total_likes,
+                    "totalEngagement": total_engagement
+                }
+        except sqlite3.Error as e:
+            print(f"❌ Error recounting post totals: {e}")
+        
+        # Likes and replies change in the table, so refresh the cached pages along with the totals
+        self._load_recent_posts()
+    
+    async def start(self):
+        """Start background flushing and resume jobs; await once from the app's startup hook"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        await self.resume_jobs()
+    
+    async def resume_jobs(self):
+        """Restart jobs that were running before the process restarted"""
+        with self._jobs_lock:
+            job_ids = [job_id for job_id, job in self._jobs_cache.items() if job.get("status") == "running"]
+        
+        for job_id in job_ids:
+            try:
+                await self.start_job(job_id)
+            except Exception as e:
+                print(f"❌ Error resuming job {job_id}: {e}")
+        
+        if job_ids:
+            print(f"✅ Resumed {len(job_ids)} running jobs")
+    
     async def start_job(self, job_id: str):
         """Start a bot job"""
         job = self.get_job(job_id)
@@ -370,21 +806,58 @@ class BotManager:
         
         print(f"Starting {job['type']} job: {job_id}")
         
-        # Create and start job thread
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        
+        # Schedule the job as a task on the running event loop
         if job["type"] == "posting":
-            thread = threading.Thread(target=self._run_posting_job, args=(job,))
+            task = asyncio.create_task(self._run_posting_job(job))
         else:
-            thread = threading.Thread(target=self._run_reply_job, args=(job,))
+            task = asyncio.create_task(self._run_reply_job(job))
         
-        thread.daemon = True
-        thread.start()
-        
-        self.running_jobs[job_id] = thread
+        self.running_jobs[job_id] = task
+        task.add_done_callback(functools.partial(self._forget_job_task, job_id))
         
         # Update job status
-        job["status"] = "running"
-        job["lastRun"] = datetime.now().isoformat()
-        self.update_job(job_id, job)
+        last_run = datetime.now().isoformat()
+        self._update_job_inplace(job_id, lambda j: j.update(status="running", lastRun=last_run))
+    
+    def _forget_job_task(self, job_id: str, task: asyncio.Task):
+        """Drop a finished task from running jobs unless the job has been restarted since"""
+        if not task.cancelled() and task.exception() is not None:
+            print(f"❌ Job {job_id} failed: {task.exception()}")
+        if self.running_jobs.get(job_id) is task:
+            del self.running_jobs[job_id]
+    
+    def _cancel_job_task(self, job_id: str):
+        """Remove a job's task from running jobs and cancel it"""
+        task = self.running_jobs.pop(job_id, None)
+        if task is None:
+            return
+        
+        try:
+            current = asyncio.current_task()
+        except RuntimeError:
+            current = None
+        
+        # A task stopping itself just returns; cancelling would abort its own cleanup
+        if task is current:
+            return
+        
+        try:
+            loop = task.get_loop()
+            if loop.is_closed():
+                return
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if running_loop is loop:
+                task.cancel()
+            else:
+                loop.call_soon_threadsafe(task.cancel)
+        except Exception as e:
+            print(f"⚠️ Could not cancel task for job {job_id}: {e}")
     
     def stop_job(self, job_id: str) -> Dict[str, Any]:
         """Stop a bot job"""
@@ -393,14 +866,10 @@ class BotManager:
             raise ValueError(f"Job {job_id} not found")
         
         # Remove from running jobs
-        if job_id in self.running_jobs:
-            del self.running_jobs[job_id]
+        self._cancel_job_task(job_id)
         
         # Update job status
-        job["status"] = "stopped"
-        job["nextRun"] = None
-        
-        return self.update_job(job_id, job)
+        return self._set_job_status(job_id, "stopped")
     
     def pause_job(self, job_id: str) -> Dict[str, Any]:
         """Pause a bot job"""
@@ -409,27 +878,34 @@ class BotManager:
             raise ValueError(f"Job {job_id} not found")
         
         # Remove from running jobs
-        if job_id in self.running_jobs:
-            del self.running_jobs[job_id]
+        self._cancel_job_task(job_id)
         
         # Update job status
-        job["status"] = "paused"
-        job["nextRun"] = None
-        
-        return self.update_job(job_id, job)
+        return self._set_job_status(job_id, "paused")
+    
+    def _set_job_status(self, job_id: str, status: str) -> Dict[str, Any]:
+        """Mark a job as no longer running and return a snapshot of it"""
+        with self._jobs_lock:
+            job = self._update_job_inplace(job_id, lambda j: j.update(status=status, nextRun=None))
+            if job is None:
+                raise ValueError(f"Job {job_id} not found")
+            return self._job_snapshot(job)
     
-    def _run_posting_job(self, job: Dict[str, Any]):
-        """Run a posting job in a separate thread"""
+    async def _run_posting_job(self, job: Dict[str, Any]):
+        """Run a posting job as an asyncio task"""
         job_id = job["id"]
         settings = job["settings"]
         
-        # Check if this job has pre-approved posts
-        if settings.get("approvedPosts") and settings.get("autoPost"):
-            self._run_scheduled_posting_job(job)
-        else:
-            self._run_regular_posting_job(job)
+        try:
+            # Check if this job has pre-approved posts
+            if settings.get("approvedPosts") and settings.get("autoPost"):
+                await self._run_scheduled_posting_job(job)
+            else:
+                await self._run_regular_posting_job(job)
+        except asyncio.CancelledError:
+            print(f"Posting job {job_id} stopped")
     
-    def _run_scheduled_posting_job(self, job: Dict[str, Any]):
+    async def _run_scheduled_posting_job(self, job: Dict[str, Any]):
         """Run a job with pre-approved, scheduled posts"""
         job_id = job["id"]
         settings = job["settings"]
@@ -438,10 +914,6 @@ class BotManager:
         print(f"Running scheduled posting job {job_id} with {len(approved_posts)} approved posts")
         
         for post in approved_posts:
-            # Check if job is still running
-            if job_id not in self.running_jobs:
-                break
-            
             try:
                 # Post the approved content
                 content = post.get("content", "")
@@ -449,29 +921,14 @@ class BotManager:
                 
                 print(f"Posting approved content: {optimized_content[:50]}...")
                 
-                # Post to Twitter
-                result = post_original_tweet(optimized_content)
-                
-                if result.get('success'):
-                    print(f"✅ Successfully posted approved content")
-                    
-                    # Save to CSV
-                    self._save_post_to_csv(optimized_content, result, post.get('topic', 'General'))
-                    
-                    # Update stats
-                    self._update_job_stats(job_id, "post_success")
-                    
-                    if result.get('tweet_id'):
-                        tweet_url = get_tweet_url(result['tweet_id'])
-                        print(f"Tweet URL: {tweet_url}")
-                else:
-                    print(f"❌ Failed to post approved content: {result.get('error', 'Unknown error')}")
-                    self._update_job_stats(job_id, "post_failure")
+                await self._post_and_record(job_id, optimized_content, post.get('topic', 'General'))
                 
                 # Wait between posts (5-15 minutes)
                 wait_time = 300 + (len(approved_posts) * 60)  # Scale wait time
-                time.sleep(min(wait_time, 900))  # Max 15 minutes
+                await asyncio.sleep(min(wait_time, 900))  # Max 15 minutes
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 print(f"❌ Error posting approved content: {e}")
                 self._update_job_stats(job_id, "post_failure")
@@ -480,7 +937,7 @@ class BotManager:
         print(f"✅ Scheduled posting job {job_id} completed")
         self.stop_job(job_id)
     
-    def _run_regular_posting_job(self, job: Dict[str, Any]):
+    async def _run_regular_posting_job(self, job: Dict[str, Any]):
         """Run a regular posting job (original functionality)"""
         job_id = job["id"]
         settings = job["settings"]
@@ -488,28 +945,41 @@ class BotManager:
         posts_per_day = settings.get("postsPerDay", 12)
         posting_hours = settings.get("postingHours", {"start": 9, "end": 21})
         
-        # Calculate posting interval
-        active_hours = posting_hours["end"] - posting_hours["start"]
-        interval_minutes = max(30, (active_hours * 60) // posts_per_day)  # Minimum 30 minutes
+        # Resolve the window and interval once; the loop below only touches locals
+        start_h, end_h = posting_hours["start"], posting_hours["end"]
+        interval_minutes = max(30, ((end_h - start_h) * 60) // posts_per_day)  # Minimum 30 minutes
+        interval_s = interval_minutes * 60
         
         print(f"Regular posting job {job_id} will post every {interval_minutes} minutes")
         
         # Post immediately if in active hours
-        current_hour = datetime.now().hour
-        if posting_hours["start"] <= current_hour < posting_hours["end"]:
-            self._execute_post(job_id, settings)
+        if start_h <= datetime.now().hour < end_h:
+            await self._execute_post(job_id, settings)
         
-        # Schedule regular posts
-        while job_id in self.running_jobs:
-            current_hour = datetime.now().hour
-            if posting_hours["start"] <= current_hour < posting_hours["end"]:
-                self._execute_post(job_id, settings)
-            
-            # Wait for next interval
-            time.sleep(interval_minutes * 60)
+        # Schedule regular posts; stop_job cancels the task mid-sleep
+        while True:
+            # Wait for the next slot, skipping straight to the next window opening
+            await asyncio.sleep(self._seconds_until_next_post(start_h, end_h, interval_s))
+            await self._execute_post(job_id, settings)
     
-    def _run_reply_job(self, job: Dict[str, Any]):
-        """Run a reply job in a separate thread"""
+    @staticmethod
+    def _seconds_until_next_post(start_h: int, end_h: int, interval_s: int,
+                                 now: Optional[datetime] = None) -> float:
+        """Seconds until the next posting slot inside the active-hours window"""
+        now = now or datetime.now()
+        next_run = now + timedelta(seconds=interval_s)
+        
+        if start_h <= next_run.hour < end_h and next_run.date() == now.date():
+            return interval_s
+        
+        # Next slot falls outside the window - sleep until the window opens instead
+        window_start = now.replace(hour=start_h, minute=0, second=0, microsecond=0)
+        if window_start <= now:
+            window_start += timedelta(days=1)
+        return (window_start - now).total_seconds()
+    
+    async def _run_reply_job(self, job: Dict[str, Any]):
+        """Run a reply job as an asyncio task"""
         job_id = job["id"]
         settings = job["settings"]
         
@@ -518,17 +988,20 @@ class BotManager:
         
         print(f"Reply job {job_id} monitoring keywords: {keywords}")
         
-        while job_id in self.running_jobs:
-            # Simulate reply monitoring and execution
-            print(f"Reply job {job_id} checking for mentions...")
-            
-            # Update stats
-            self._update_job_stats(job_id, "reply_success")
-            
-            # Wait 10 minutes before next check (Railway-friendly)
-            time.sleep(10 * 60)
+        try:
+            while True:
+                # Simulate reply monitoring and execution
+                print(f"Reply job {job_id} checking for mentions...")
+                
+                # Update stats
+                self._update_job_stats(job_id, "reply_success")
+                
+                # Wait 10 minutes before next check (Railway-friendly)
+                await asyncio.sleep(10 * 60)
+        except asyncio.CancelledError:
+            print(f"Reply job {job_id} stopped")
     
-    def _execute_post(self, job_id: str, settings: Dict[str, Any]):
+    async def _execute_post(self, job_id: str, settings: Dict[str, Any]):
         """Execute a single post"""
         try:
             print(f"Executing post for job {job_id}")
@@ -538,7 +1011,7 @@ class BotManager:
             selected_topic = topics[0] if topics else "Pokemon TCG"
             
             # Generate content using your existing system
-            viral_posts = generate_viral_content(1, topic=selected_topic)
+            viral_posts = await asyncio.to_thread(generate_viral_content, 1, topic=selected_topic)
             
             if viral_posts:
                 post = viral_posts[0]
@@ -546,189 +1019,221 @@ class BotManager:
                 
                 print(f"Generated content: {optimized_content}")
                 
-                # Post to Twitter
-                result = post_original_tweet(optimized_content)
-                
-                if result.get('success'):
-                    print(f"✅ Successfully posted: {optimized_content[:50]}...")
-                    
-                    # Save to CSV
-                    self._save_post_to_csv(optimized_content, result, post.get('topic', 'General'))
-                    
-                    # Update stats
-                    self._update_job_stats(job_id, "post_success")
-                    
-                    if result.get('tweet_id'):
-                        tweet_url = get_tweet_url(result['tweet_id'])
-                        print(f"Tweet URL: {tweet_url}")
-                else:
-                    print(f"❌ Failed to post: {result.get('error', 'Unknown error')}")
-                    self._update_job_stats(job_id, "post_failure")
+                await self._post_and_record(job_id, optimized_content, post.get('topic', 'General'))
             else:
                 print("❌ Failed to generate content")
                 self._update_job_stats(job_id, "post_failure")
                 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             print(f"❌ Error executing post: {e}")
             self._update_job_stats(job_id, "post_failure")
     
-    def _save_post_to_csv(self, content: str, result: Dict[str, Any], topic: str):
-        """Save post to CSV file"""
+    async def _post_and_record(self, job_id: str, content: str, topic: str) -> bool:
+        """Post a tweet, then record the post and the job's stats"""
+        # Post to Twitter (blocking HTTP call, keep it off the event loop)
+        result = await asyncio.to_thread(post_original_tweet, content)
+        
+        if not result.get('success'):
+            print(f"❌ Failed to post: {result.get('error', 'Unknown error')}")
+            self._update_job_stats(job_id, "post_failure")
+            return False
+        
+        print(f"✅ Successfully posted: {content[:50]}...")
+        
+        self._save_post(content, result, topic)
+        self._update_job_stats(job_id, "post_success")
+        
+        if result.get('tweet_id'):
+            print(f"Tweet URL: {get_tweet_url(result['tweet_id'])}")
+        return True
+    
+    def _save_post(self, content: str, result: Dict[str, Any], topic: str):
+        """Save posted tweet to the posts table"""
         try:
-            csv_path = self.data_dir / "posts.csv"
+            topics = [topic, 'PokemonTCG', 'TradeUp']
+            now = datetime.now()  # Fallback id and timestamp come from the same clock read
             
-            # Check if file exists and add header if needed
-            file_exists = csv_path.exists()
+            row = (
+                str(result.get('tweet_id', int(now.timestamp()))),
+                content,
+                0,  # Initial likes
+                0,  # Initial retweets
+                0,  # Initial replies
+                _json_dumps(topics),
+                now.isoformat()
+            )
+            with self._db_lock:
+                # INSERT OR REPLACE keeps one row per id, so the cache and the totals do too
+                post = self._post_row_to_dict(row)
+                index = next((i for i, cached in enumerate(self._recent_posts) if cached["id"] == row[0]), None)
+                if index is not None:
+                    self._recent_posts[index] = post
+                else:
+                    # Queued ids are in the cache, so only the table needs checking here. The check
+                    # runs before the row is queued so a flush can't insert it first.
+                    if self._db.execute("SELECT 1 FROM posts WHERE id = ?", (row[0],)).fetchone() is None:
+                        self._post_totals["totalPosts"] += 1
+                    self._recent_posts.appendleft(post)
+                self._posts_queue.put(row)
             
-            with open(csv_path, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                
-                if not file_exists:
-                    writer.writerow(['id', 'content', 'likes', 'retweets', 'replies', 'topics', 'timestamp'])
-                
-                topics = [topic, 'PokemonTCG', 'TradeUp']
-                
-                writer.writerow([
-                    result.get('tweet_id', int(time.time())),
-                    content,
-                    0,  # Initial likes
-                    0,  # Initial retweets
-                    0,  # Initial replies
-                    json.dumps(topics),
-                    datetime.now().isoformat()
-                ])
-                
-            print(f"✅ Saved post to CSV")
+            print(f"✅ Queued post for saving")
         except Exception as e:
-            print(f"❌ Error saving post to CSV: {e}")
+            print(f"❌ Error saving post: {e}")
+    
+    def _flush_posts_queue(self):
+        """Insert all queued posts in one transaction"""
+        rows = []
+        while True:
+            try:
+                rows.append(self._posts_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        if not rows:
+            return
+        
+        try:
+            with self._db_transaction():
+                self._db.executemany("INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            print(f"❌ Error saving {len(rows)} posts: {e}")
     
     def _update_job_stats(self, job_id: str, event_type: str):
         """Update job statistics"""
-        try:
-            job = self.get_job(job_id)
-            if not job:
-                return
-            
-            stats = job.get("stats", {})
+        def apply(job: Dict[str, Any]):
+            stats = job.setdefault("stats", {})
             
             if event_type == "post_success":
                 stats["postsToday"] = stats.get("postsToday", 0) + 1
             elif event_type == "reply_success":
                 stats["repliesToday"] = stats.get("repliesToday", 0) + 1
-            elif event_type == "post_failure":
-                # Decrease success rate slightly on failure
-                current_rate = stats.get("successRate", 100)
-                stats["successRate"] = max(50, current_rate - 2)
             
-            # Improve success rate on success
+            # Raw counters; the success rate is derived from them when read
+            stats["attempts"] = stats.get("attempts", 0) + 1
             if event_type.endswith("_success"):
-                current_rate = stats.get("successRate", 100)
-                stats["successRate"] = min(100, current_rate + 1)
-            
-            job["stats"] = stats
-            self.update_job(job_id, job)
-            
+                stats["successes"] = stats.get("successes", 0) + 1
+        
+        if self._update_job_inplace(job_id, apply, persist=False) is not None:
             print(f"✅ Updated job stats: {event_type}")
-        except Exception as e:
-            print(f"❌ Error updating job stats: {e}")
+    
+    def _success_rate(self) -> int:
+        """Success rate across all jobs, as a percentage"""
+        successes = 0
+        attempts = 0
+        with self._jobs_lock:
+            for job in self._jobs_cache.values():
+                stats = job.get("stats", {})
+                successes += stats.get("successes", 0)
+                attempts += stats.get("attempts", 0)
+        return _success_percent(successes, attempts)
     
     def get_status(self) -> Dict[str, Any]:
         """Get overall bot status"""
         try:
-            with open(self.status_file, 'r') as f:
-                status = json.load(f)
+            st = self.status_file.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            if self._status_cache is None or self._status_cache[0] != key:
+                self._status_cache = (key, self._read_json(self.status_file))
+            
+            # Copy the cached file contents before adding live fields
+            status = dict(self._status_cache[1])
+            status["stats"] = dict(status.get("stats", {}))
             
             # Add current running jobs info
             status["active_jobs"] = len(self.running_jobs)
             status["running"] = len(self.running_jobs) > 0
-            status["pending_approvals"] = len([p for p in self.generated_posts if p.get("approved") is None])
-            
-            return status
-        except:
-            return {
-                "running": False,
-                "uptime": None,
-                "lastRun": None,
-                "active_jobs": 0,
-                "pending_approvals": 0,
-                "stats": {
-                    "postsToday": 0,
-                    "repliesToday": 0,
-                    "successRate": 100
-                }
-            }
+            status["pending_approvals"] = self._approval_counts[None]
+        except (OSError, ValueError):
+            status = _json_loads(_DEFAULT_STATUS_BYTES)
+            status["active_jobs"] = 0
+            status["pending_approvals"] = 0
+        
+        status.setdefault("stats", {})["successRate"] = self._success_rate()
+        return status
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get bot metrics"""
-        # Calculate metrics from actual data if available
-        try:
-            csv_path = self.data_dir / "posts.csv"
-            if csv_path.exists():
-                df = pd.read_csv(csv_path)
-                total_posts = len(df)
-                total_likes = df['likes'].sum() if 'likes' in df.columns else 0
-                avg_engagement = df['likes'].mean() if 'likes' in df.columns and len(df) > 0 else 0
-            else:
-                total_posts = 0
-                total_likes = 0
-                avg_engagement = 0
-            
-            # Add approval workflow metrics
-            approved_posts = len([p for p in self.generated_posts if p.get("approved") is True])
-            pending_posts = len([p for p in self.generated_posts if p.get("approved") is None])
-            
-        except:
-            total_posts = 0
-            total_likes = 0
-            avg_engagement = 0
-            approved_posts = 0
-            pending_posts = 0
+        with self._db_lock:
+            totals = dict(self._post_totals)
+        total_posts = totals["totalPosts"]
+        avg_engagement = totals["totalEngagement"] / total_posts if total_posts else 0
+        
+        # Add approval workflow metrics
+        approved_posts = self._approval_counts[True]
+        pending_posts = self._approval_counts[None]
         
         return {
             "totalPosts": total_posts,
             "avgEngagement": round(avg_engagement, 1),
-            "totalLikes": int(total_likes),
+            "totalLikes": int(totals["totalLikes"]),
             "followers": 3421,  # This would come from Twitter API
             "approvedPosts": approved_posts,
             "pendingApproval": pending_posts,
+            "successRate": self._success_rate(),
             "lastUpdated": datetime.now().isoformat()
         }
     
+    @staticmethod
+    def _post_row_to_dict(row) -> Dict[str, Any]:
+        """Shape a posts table row for the API"""
+        post_id, content, likes, retweets, replies, topics_json, timestamp = row
+        try:
+            topics = _json_loads(topics_json) if topics_json else []
+        except:
+            topics = []
+        
+        return {
+            "id": post_id,
+            "content": content or "",
+            "engagement": {
+                "likes": likes or 0,
+                "retweets": retweets or 0,
+                "replies": replies or 0
+            },
+            "timestamp": timestamp,
+            "topics": topics
+        }
+    
+    def _load_recent_posts(self):
+        """Fill the recent posts cache from the posts table"""
+        try:
+            with self._db_lock:
+                rows = self._db.execute(
+                    "SELECT id, content, likes, retweets, replies, topics, timestamp FROM posts "
+                    "ORDER BY timestamp DESC LIMIT ?",
+                    (RECENT_POSTS_CACHE_SIZE,)
+                ).fetchall()
+                self._recent_posts.clear()
+                self._recent_posts.extend(self._post_row_to_dict(row) for row in rows)
+        except sqlite3.Error as e:
+            print(f"❌ Error loading recent posts: {e}")
+    
     def get_posts(self, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
         """Get recent posts"""
         try:
-            csv_path = self.data_dir / "posts.csv"
-            
-            if not csv_path.exists():
-                return {"posts": [], "total": 0, "hasMore": False}
-            
-            df = pd.read_csv(csv_path)
-            
-            # Sort by timestamp (newest first)
-            df = df.sort_values('timestamp', ascending=False)
-            
-            # Paginate
-            total = len(df)
-            posts_df = df.iloc[offset:offset + limit]
-            
-            posts = []
-            for _, row in posts_df.iterrows():
-                try:
-                    topics = json.loads(row['topics']) if 'topics' in row and pd.notna(row['topics']) else []
-                except:
-                    topics = []
+            with self._db_lock:
+                # The totals rollup stands in for a COUNT(*) scan on every page
+                total = self._post_totals["totalPosts"]
                 
-                posts.append({
-                    "id": str(row['id']) if 'id' in row else str(int(time.time())),
-                    "content": row['content'] if 'content' in row else "",
-                    "engagement": {
-                        "likes": int(row['likes']) if 'likes' in row and pd.notna(row['likes']) else 0,
-                        "retweets": int(row['retweets']) if 'retweets' in row and pd.notna(row['retweets']) else 0,
-                        "replies": int(row['replies']) if 'replies' in row and pd.notna(row['replies']) else 0
-                    },
-                    "timestamp": row['timestamp'] if 'timestamp' in row else datetime.now().isoformat(),
-                    "topics": topics
-                })
+                # A cache that isn't full holds every post, so any page can be served from it
+                cached = len(self._recent_posts)
+                if offset + limit <= cached or cached < RECENT_POSTS_CACHE_SIZE:
+                    posts = list(itertools.islice(self._recent_posts, offset, offset + limit))
+                else:
+                    posts = None
+            
+            if posts is None:
+                # Deep pagination falls back to the indexed query
+                self._flush_posts_queue()
+                with self._db_lock:
+                    rows = self._db.execute(
+                        "SELECT id, content, likes, retweets, replies, topics, timestamp FROM posts "
+                        "ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+                        (limit, offset)
+                    ).fetchall()
+                posts = [self._post_row_to_dict(row) for row in rows]
             
             return {
                 "posts": posts,
@@ -741,51 +1246,23 @@ class BotManager:
     
     def get_topics(self) -> List[Dict[str, Any]]:
         """Get trending topics"""
-        return [
-            {"name": "Charizard", "count": 89, "trend": "up", "percentage": 28},
-            {"name": "Pikachu", "count": 76, "trend": "up", "percentage": 24},
-            {"name": "Booster Packs", "count": 65, "trend": "stable", "percentage": 20},
-            {"name": "Tournament", "count": 45, "trend": "up", "percentage": 14},
-            {"name": "Trading", "count": 32, "trend": "down", "percentage": 10},
-            {"name": "Collection", "count": 13, "trend": "stable", "percentage": 4}
-        ]
+        return list(_TOPICS)
     
     def get_engagement_data(self, days: int = 7) -> List[Dict[str, Any]]:
         """Get engagement data for charts"""
-        data = []
-        for i in range(days):
-            date = datetime.now() - timedelta(days=i)
-            data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "engagement": round(5 + (i * 0.5), 1),
-                "posts": 10 + i
-            })
-        return list(reversed(data))
+        return _engagement_series(days, date.today().toordinal())
     
     def get_settings(self) -> Dict[str, Any]:
         """Get bot settings"""
         try:
-            with open(self.settings_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {
-                "postsPerDay": 12,
-                "keywords": ["Pokemon", "TCG", "Charizard", "Pikachu"],
-                "engagementMode": "balanced",
-                "autoReply": True,
-                "contentTypes": {
-                    "cardPulls": True,
-                    "deckBuilding": True,
-                    "marketAnalysis": True,
-                    "tournaments": True
-                }
-            }
+            return self._read_json(self.settings_file)
+        except (OSError, ValueError):
+            return _json_loads(_DEFAULT_SETTINGS_BYTES)
     
     def update_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Update bot settings"""
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            self._atomic_write_json(self.settings_file, settings, indent=True)
         except Exception as e:
             print(f"Error updating settings: {e}")
         return settings
@@ -793,24 +1270,28 @@ class BotManager:
     def cleanup_old_posts(self, days_old: int = 7):
         """Clean up old generated posts to prevent memory bloat"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_old)
+            # created_at is always written with isoformat(), so the strings compare in time order
+            cutoff_iso = (datetime.now() - timedelta(days=days_old)).isoformat()
             
             # Remove old posts that are either approved/rejected or very old
             original_count = len(self.generated_posts)
             
-            self.generated_posts = [
-                post for post in self.generated_posts
-                if (post.get("approved") is None and 
-                    datetime.fromisoformat(post.get("created_at", "2020-01-01")) > cutoff_date)
-                or post.get("approved") is True  # Keep approved posts longer
-            ]
+            kept = []
+            for post in self.generated_posts:
+                approved = post.get("approved")
+                if approved is True:  # Keep approved posts longer
+                    kept.append(post)
+                elif approved is None and post.get("created_at", "2020-01-01") > cutoff_iso:
+                    kept.append(post)
+            self.generated_posts = kept
             
             cleaned_count = original_count - len(self.generated_posts)
             
             if cleaned_count > 0:
-                # Save updated posts
-                with open(self.generated_posts_file, 'w') as f:
-                    json.dump(self.generated_posts, f, indent=2)
+                self._reindex_generated_posts()
+                
+                # Removals aren't logged; write a fresh snapshot instead
+                self._compact_generated_posts(force=True)
                 
                 print(f"✅ Cleaned up {cleaned_count} old generated posts")
             
@@ -821,10 +1302,10 @@ class BotManager:
         """Get statistics about the approval workflow"""
         try:
             total_generated = len(self.generated_posts)
-            approved_count = len([p for p in self.generated_posts if p.get("approved") is True])
-            rejected_count = len([p for p in self.generated_posts if p.get("approved") is False])
-            pending_count = len([p for p in self.generated_posts if p.get("approved") is None])
-            scheduled_count = len([p for p in self.generated_posts if p.get("scheduled") is True])
+            approved_count = self._approval_counts[True]
+            rejected_count = self._approval_counts[False]
+            pending_count = self._approval_counts[None]
+            scheduled_count = self._scheduled_count
             
             approval_rate = (approved_count / total_generated * 100) if total_generated > 0 else 0
             
@@ -835,9 +1316,7 @@ class BotManager:
                 "pending": pending_count,
                 "scheduled": scheduled_count,
                 "approval_rate": round(approval_rate, 1),
-                "last_generated": max([
-                    p.get("created_at", "") for p in self.generated_posts
-                ], default=None)
+                "last_generated": self._last_generated_at
             }
         except Exception as e:
             print(f"Error getting approval workflow stats: {e}")
@@ -856,12 +1335,14 @@ class BotManager:
         try:
             approved_count = 0
             failed_count = 0
+            approved_at = datetime.now().isoformat()
             
-            for post_id in post_ids:
-                if self.approve_post(post_id):
-                    approved_count += 1
-                else:
-                    failed_count += 1
+            with self._batched_post_log():
+                for post_id in post_ids:
+                    if self.approve_post(post_id, approved_at):
+                        approved_count += 1
+                    else:
+                        failed_count += 1
             
             return {
                 "approved_count": approved_count,
@@ -882,12 +1363,14 @@ class BotManager:
         try:
             rejected_count = 0
             failed_count = 0
+            rejected_at = datetime.now().isoformat()
             
-            for post_id in post_ids:
-                if self.reject_post(post_id):
-                    rejected_count += 1
-                else:
-                    failed_count += 1
+            with self._batched_post_log():
+                for post_id in post_ids:
+                    if self.reject_post(post_id, rejected_at):
+                        rejected_count += 1
+                    else:
+                        failed_count += 1
             
             return {
                 "rejected_count": rejected_count,
@@ -907,11 +1390,7 @@ class BotManager:
         """Regenerate content for a specific post"""
         try:
             # Find the post
-            target_post = None
-            for post in self.generated_posts:
-                if post.get("id") == post_id:
-                    target_post = post
-                    break
+            target_post = self._posts_by_id.get(post_id)
             
             if not target_post:
                 return {"success": False, "error": "Post not found"}
@@ -922,16 +1401,14 @@ class BotManager:
             
             if new_content and len(new_content) > 0:
                 # Update the post with new content
-                target_post["content"] = new_content[0].get("content", target_post["content"])
-                target_post["engagement_score"] = new_content[0].get("engagement_score", 0.75)
-                target_post["hashtags"] = new_content[0].get("hashtags", target_post.get("hashtags", []))
-                target_post["mentions_tradeup"] = new_content[0].get("mentions_tradeup", False)
-                target_post["regenerated_at"] = datetime.now().isoformat()
-                target_post["approved"] = None  # Reset approval status
-                
-                # Save updated posts
-                with open(self.generated_posts_file, 'w') as f:
-                    json.dump(self.generated_posts, f, indent=2)
+                self._update_generated_post(target_post, {
+                    "content": new_content[0].get("content", target_post["content"]),
+                    "engagement_score": new_content[0].get("engagement_score", 0.75),
+                    "hashtags": new_content[0].get("hashtags", target_post.get("hashtags", [])),
+                    "mentions_tradeup": new_content[0].get("mentions_tradeup", False),
+                    "regenerated_at": datetime.now().isoformat(),
+                    "approved": None  # Reset approval status
+                })
                 
                 print(f"✅ Regenerated content for post: {post_id}")
                 return {"success": True, "post": target_post}
@@ -945,17 +1422,17 @@ class BotManager:
     def export_posts_data(self, format_type: str = "json") -> Dict[str, Any]:
         """Export posts data in various formats"""
         try:
+            now = datetime.now()
             if format_type.lower() == "json":
                 export_data = {
                     "generated_posts": self.generated_posts,
                     "jobs": self.get_all_jobs(),
                     "settings": self.get_settings(),
-                    "export_timestamp": datetime.now().isoformat()
+                    "export_timestamp": now.isoformat()
                 }
                 
-                export_path = self.data_dir / f"posts_export_{int(datetime.now().timestamp())}.json"
-                with open(export_path, 'w') as f:
-                    json.dump(export_data, f, indent=2)
+                export_path = self.data_dir / f"posts_export_{int(now.timestamp())}.json"
+                self._atomic_write_json(export_path, export_data, indent=True)
                 
                 return {
                     "success": True,
@@ -965,30 +1442,21 @@ class BotManager:
                 }
             
             elif format_type.lower() == "csv":
-                # Export to CSV format
-                csv_data = []
-                for post in self.generated_posts:
-                    csv_data.append({
-                        "id": post.get("id", ""),
-                        "content": post.get("content", ""),
-                        "topic": post.get("topic", ""),
-                        "approved": post.get("approved", ""),
-                        "scheduled_time": post.get("scheduledTime", ""),
-                        "engagement_score": post.get("engagement_score", ""),
-                        "created_at": post.get("created_at", ""),
-                        "approved_at": post.get("approved_at", ""),
-                        "scheduled": post.get("scheduled", False)
-                    })
-                
-                export_path = self.data_dir / f"posts_export_{int(datetime.now().timestamp())}.csv"
-                df = pd.DataFrame(csv_data)
-                df.to_csv(export_path, index=False)
+                # Export to CSV format, one row per post straight from memory
+                export_path = self.data_dir / f"posts_export_{int(now.timestamp())}.csv"
+                records_count = 0
+                with open(export_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow([header for header, _, _ in _EXPORT_CSV_COLUMNS])
+                    for post in self.generated_posts:
+                        writer.writerow([post.get(key, default) for _, key, default in _EXPORT_CSV_COLUMNS])
+                        records_count += 1
                 
                 return {
                     "success": True,
                     "file_path": str(export_path),
                     "format": "csv",
-                    "records_count": len(csv_data)
+                    "records_count": records_count
                 }
             
             else:
@@ -6,20 +6,29 @@ Handles API calls with rate limiting and batch processing using OpenAI.
 
 import os
 import time
-import random
+import asyncio
 import json
 import re
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+import httpx
 import logging
 
+# HTTP/2 lets concurrent async calls share one TLS connection; it needs the h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
-from src.config import OPENAI_API_KEY
+from src.config import OPENAI_API_KEY, POKEMON_KEYWORDS
 logging.info(f"🔑 LLM Manager - OPENAI_API_KEY loaded: {'✅ Yes' if OPENAI_API_KEY else '❌ No'}")
-if OPENAI_API_KEY:
-    logging.info(f"🔑 LLM Manager - Key length: {len(OPENAI_API_KEY)}")
-    logging.info(f"🔑 LLM Manager - Key starts with: {OPENAI_API_KEY[:15]}...")
-else:
+if not OPENAI_API_KEY:
     logging.error("❌ LLM Manager - No OPENAI_API_KEY found in config")
     # Try direct environment access as fallback
     direct_key = os.getenv('OPENAI_API_KEY')
@@ -34,10 +43,64 @@ MAX_DELAY = 5.0  # Maximum delay for exponential backoff
 MAX_RETRIES = 3  # Maximum number of retries per API call
 BATCH_SIZE = 5   # Process in batches of this size
 BATCH_PAUSE = 3  # Seconds to pause between batches
+RATE_LIMIT_PER_MINUTE = 60  # Sustained OpenAI requests per minute (token bucket refill rate)
+RATE_LIMIT_BURST = 5  # Requests allowed back-to-back before the bucket starts spacing calls
+
+# Returned by call_llm/acall_llm when every retry failed
+LLM_ERROR_RESPONSE = "POKEMON_RELATED: NO\nREPLY: Error: Unable to generate response after multiple attempts."
+
+# Default chat model; cheaper and faster than gpt-3.5-turbo and supports JSON mode
+DEFAULT_MODEL = "gpt-4o-mini"
 
 # Constants for batch processing
 MAX_TWEETS_PER_BATCH = 5  # Maximum number of tweets to process in a single API call
 MAX_TOKENS_PER_BATCH = 4000  # Maximum tokens for a batch prompt
+MAX_CONCURRENT_BATCHES = 8  # Batch prompts allowed in flight at once on the async path
+HTTP_TIMEOUT = 30  # Seconds before an OpenAI HTTP request times out
+HTTP_MAX_CONNECTIONS = 64  # Connection pool size for the async OpenAI client
+HTTP_MAX_KEEPALIVE = 32  # Idle connections kept open for reuse
+TWEET_CACHE_SIZE = 10000  # Maximum classified tweets remembered in memory
+
+# Response parsing patterns, compiled once at import
+_TWEET_RE = re.compile(r'TWEET (\d+):\s*POKEMON_RELATED: (YES|NO)(?:\s*REPLY: (.*?))?(?=\s*TWEET \d+:|$)', re.DOTALL)
+_REPLY_RE = re.compile(r'REPLY: (.*?)($|POKEMON_RELATED:)', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Cheap pre-filter: tweets matching none of these never reach the API. It only needs
+# high recall, since anything it lets through is still classified by the model.
+_POKE_RE = re.compile(
+    r'\b(?:pok[eé]mon|ptcg|tcg|booster|etb|psa\s?\d+|bgs|cgc|graded|grading|holo|pulls?|pulled|'
+    + '|'.join(re.escape(keyword) for keyword in sorted(POKEMON_KEYWORDS, key=len, reverse=True))
+    + r')\b',
+    re.IGNORECASE
+)
+
+def _tweet_cache_key(text: str) -> str:
+    """Hash tweet text after normalizing case and whitespace."""
+    normalized = _WHITESPACE_RE.sub(' ', text.lower().strip())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+# Opening line of every batch user prompt, followed by the numbered tweets
+BATCH_PROMPT_HEADER = "Here are the tweets:\n\n"
+
+# Static instructions for batch prompts. Kept byte-identical across calls and sent
+# first as the system message so OpenAI's automatic prompt caching can reuse it.
+BATCH_SYSTEM_PROMPT = """
+You are an AI assistant for TradeUp, a platform for trading Pokémon cards.
+
+I will provide you with multiple numbered tweets. For each tweet, determine if it's related to Pokémon cards or the Pokémon Trading Card Game (TCG).
+
+For each tweet that IS related to Pokémon cards, write a friendly reply that:
+1. Reacts naturally to the tweet's content
+2. Adds a fun fact or mini price insight if relevant
+3. Ends with "Trade safely on TradeUp!"
+
+For tweets that are NOT related to Pokémon cards, set "pokemon" to false and leave "reply" empty.
+
+Respond with a JSON object only, with one entry per tweet, in this exact shape:
+
+{"tweets": [{"i": 1, "pokemon": true, "reply": "Your reply text here"}, {"i": 2, "pokemon": false, "reply": ""}]}
+"""
 
 class LLMManager:
     """
@@ -53,48 +116,100 @@ class LLMManager:
             raise ValueError("OPENAI_API_KEY is required but not found")
         
         self.client = OpenAI(api_key=OPENAI_API_KEY)
+        self.aclient = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=HTTP_MAX_KEEPALIVE, max_connections=HTTP_MAX_CONNECTIONS),
+                timeout=HTTP_TIMEOUT
+            )
+        )
+        self._sem = None  # created on first async use so it binds to the running loop
+        self._tweet_cache = OrderedDict()  # cache key -> (is_pokemon, reply)
+        self._tweet_cache_lock = threading.Lock()
         self.call_count = 0
         self.last_call_time = 0
         self.consecutive_errors = 0
+        self._bucket_tokens = float(RATE_LIMIT_BURST)
+        self._bucket_updated = time.monotonic()
+        self._rate_lock = threading.Lock()
         
         logging.info("✅ LLM Manager initialized with OpenAI successfully")
         print("LLM Manager initialized with OpenAI")
         
+    def _reserve_call_slot(self) -> float:
+        """
+        Take a token from the rate-limit bucket and return how long to wait for it.
+        
+        The bucket refills at RATE_LIMIT_PER_MINUTE and holds up to RATE_LIMIT_BURST
+        tokens. Tokens may go negative, which queues callers in reservation order,
+        so concurrent sync and async callers share one budget. Consecutive errors
+        add an exponential backoff on top.
+        
+        Returns:
+            Seconds the caller should wait before making its API call
+        """
+        refill_rate = RATE_LIMIT_PER_MINUTE / 60.0
+        
+        with self._rate_lock:
+            now = time.monotonic()
+            self._bucket_tokens = min(RATE_LIMIT_BURST, self._bucket_tokens + (now - self._bucket_updated) * refill_rate)
+            self._bucket_updated = now
+            self._bucket_tokens -= 1
+            
+            wait_time = -self._bucket_tokens / refill_rate if self._bucket_tokens < 0 else 0.0
+            
+            # Back off further while the API keeps failing
+            if self.consecutive_errors:
+                wait_time += min(MIN_DELAY * 2 ** self.consecutive_errors, MAX_DELAY)
+                
+            self.last_call_time = time.time() + wait_time
+            self.call_count += 1
+            
+        if wait_time > 0:
+            print(f"Rate limiting: Waiting {wait_time:.2f}s before next API call")
+        return wait_time
+        
     def _apply_rate_limiting(self):
         """Apply rate limiting between API calls."""
-        current_time = time.time()
-        elapsed = current_time - self.last_call_time
+        time.sleep(self._reserve_call_slot())
         
-        # Calculate delay based on call count and consecutive errors
-        base_delay = MIN_DELAY * (1 + (self.call_count % 10) / 10)
-        error_factor = min(2 ** self.consecutive_errors, MAX_DELAY / base_delay)
-        delay = min(base_delay * error_factor, MAX_DELAY)
+    async def _apply_rate_limiting_async(self):
+        """Apply rate limiting between API calls without blocking the event loop."""
+        await asyncio.sleep(self._reserve_call_slot())
         
-        # If not enough time has elapsed, sleep
-        if elapsed < delay:
-            sleep_time = delay - elapsed
-            print(f"Rate limiting: Waiting {sleep_time:.2f}s before next API call")
-            time.sleep(sleep_time)
-            
-        # Add small random jitter to avoid synchronized requests
-        jitter = random.uniform(0.1, 0.5)
-        time.sleep(jitter)
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent batch prompts."""
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+        return self._sem
         
-        # Apply batch pausing
-        if self.call_count > 0 and self.call_count % BATCH_SIZE == 0:
-            print(f"Completed batch of {BATCH_SIZE} calls. Pausing for {BATCH_PAUSE}s...")
-            time.sleep(BATCH_PAUSE)
-            
-        self.last_call_time = time.time()
-        self.call_count += 1
+    @staticmethod
+    def _build_messages(prompt: str, system: Optional[str] = None) -> List[Dict[str, str]]:
+        """Build the chat messages, putting the static system prefix first."""
+        if system:
+            return [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+        return [{"role": "user", "content": prompt}]
+        
+    @staticmethod
+    def _log_cached_tokens(response):
+        """Log how many prompt tokens were served from OpenAI's prompt cache."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens is not None:
+            logging.info(f"🧠 Prompt cache: {cached_tokens}/{usage.prompt_tokens} prompt tokens cached")
         
-    def call_llm(self, prompt: str, model: str = "gpt-3.5-turbo") -> str:
+    def call_llm(self, prompt: str, model: str = DEFAULT_MODEL, system: Optional[str] = None,
+                 json_mode: bool = False) -> str:
         """
         Call OpenAI API with rate limiting and retry logic.
         
         Args:
             prompt: The prompt to send to the LLM
             model: OpenAI model to use
+            system: Optional static system message sent ahead of the prompt
+            json_mode: Ask the model for a JSON object response
             
         Returns:
             The generated text response
@@ -108,13 +223,15 @@ class LLMManager:
             try:
                 response = self.client.chat.completions.create(
                     model=model,
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=self._build_messages(prompt, system),
                     temperature=0.7,
-                    max_tokens=2000
+                    max_tokens=2000,
+                    **({"response_format": {"type": "json_object"}} if json_mode else {})
                 )
                 
                 # Reset consecutive errors on success
                 self.consecutive_errors = 0
+                self._log_cached_tokens(response)
                 return response.choices[0].message.content
                 
             except Exception as e:
@@ -135,7 +252,61 @@ class LLMManager:
                     continue
                     
         # If all retries failed, return error message
-        return "POKEMON_RELATED: NO\nREPLY: Error: Unable to generate response after multiple attempts."
+        return LLM_ERROR_RESPONSE
+        
+    async def acall_llm(self, prompt: str, model: str = DEFAULT_MODEL, system: Optional[str] = None,
+                        json_mode: bool = False) -> str:
+        """
+        Async version of call_llm using the AsyncOpenAI client.
+        
+        Args:
+            prompt: The prompt to send to the LLM
+            model: OpenAI model to use
+            system: Optional static system message sent ahead of the prompt
+            json_mode: Ask the model for a JSON object response
+            
+        Returns:
+            The generated text response
+        """
+        retries = 0
+        
+        while retries < MAX_RETRIES:
+            # Apply rate limiting
+            await self._apply_rate_limiting_async()
+            
+            try:
+                response = await self.aclient.chat.completions.create(
+                    model=model,
+                    messages=self._build_messages(prompt, system),
+                    temperature=0.7,
+                    max_tokens=2000,
+                    **({"response_format": {"type": "json_object"}} if json_mode else {})
+                )
+                
+                # Reset consecutive errors on success
+                self.consecutive_errors = 0
+                self._log_cached_tokens(response)
+                return response.choices[0].message.content
+                
+            except Exception as e:
+                error_message = str(e)
+                retries += 1
+                self.consecutive_errors += 1
+                
+                print(f"Error calling OpenAI API: {error_message}")
+                
+                # Check for rate limiting errors
+                if "429" in error_message or "Too Many Requests" in error_message:
+                    print(f"Rate limit hit. Attempt {retries}/{MAX_RETRIES}")
+                    
+                    # Use exponential backoff
+                    backoff_time = min(2 ** retries, MAX_DELAY * 2)
+                    print(f"Backing off for {backoff_time}s before retry...")
+                    await asyncio.sleep(backoff_time)
+                    continue
+                    
+        # If all retries failed, return error message
+        return LLM_ERROR_RESPONSE
         
     def process_in_batches(self, items: List[Any], process_func, batch_size: int = None) -> List[Any]:
         """
@@ -179,20 +350,129 @@ class LLMManager:
         Returns:
             List of tuples (tweet, is_pokemon, reply)
         """
-        results = []
+        # Obviously non-Pokémon tweets, and tweets seen before, skip the API call
+        prefiltered, candidates = self._prefilter_tweets(tweets)
+        cached_results, misses = self._split_cached_tweets(candidates)
+        miss_results = []
         
         # Process tweets in batches to avoid token limits
-        for i in range(0, len(tweets), MAX_TWEETS_PER_BATCH):
-            batch = tweets[i:i+MAX_TWEETS_PER_BATCH]
+        for i in range(0, len(misses), MAX_TWEETS_PER_BATCH):
+            batch = misses[i:i+MAX_TWEETS_PER_BATCH]
             batch_results = self._process_tweet_batch(batch)
-            results.extend(batch_results)
+            miss_results.extend(batch_results)
             
-        return results
+        return self._fill_results(prefiltered, self._merge_cached_results(cached_results, miss_results))
+        
+    async def abatch_process_tweets(self, tweets: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], bool, str]]:
+        """
+        Async version of batch_process_tweets that sends the batch prompts concurrently.
+        
+        Args:
+            tweets: List of tweet dictionaries
+            
+        Returns:
+            List of tuples (tweet, is_pokemon, reply), in the same order as tweets
+        """
+        prefiltered, candidates = self._prefilter_tweets(tweets)
+        cached_results, misses = self._split_cached_tweets(candidates)
+        
+        batches = [misses[i:i+MAX_TWEETS_PER_BATCH] for i in range(0, len(misses), MAX_TWEETS_PER_BATCH)]
+        batch_results = await asyncio.gather(*[self._aprocess_tweet_batch(batch) for batch in batches])
+        
+        miss_results = []
+        for batch_result in batch_results:
+            miss_results.extend(batch_result)
+        return self._fill_results(prefiltered, self._merge_cached_results(cached_results, miss_results))
+        
+    def _prefilter_tweets(self, tweets: List[Dict[str, Any]]) -> Tuple[List[Optional[Tuple[Dict[str, Any], bool, str]]], List[Dict[str, Any]]]:
+        """
+        Drop tweets with no Pokémon keyword before any API call.
+        
+        Args:
+            tweets: List of tweet dictionaries
+            
+        Returns:
+            Tuple of (results with None for each candidate, candidate tweets)
+        """
+        prefiltered = []
+        candidates = []
+        
+        for tweet in tweets:
+            if _POKE_RE.search(tweet.get('text', '')):
+                prefiltered.append(None)
+                candidates.append(tweet)
+            else:
+                prefiltered.append((tweet, False, ""))
+                
+        if len(candidates) < len(tweets):
+            print(f"Pre-filter: skipped {len(tweets) - len(candidates)}/{len(tweets)} non-Pokémon tweets")
+        return prefiltered, candidates
+        
+    def _split_cached_tweets(self, tweets: List[Dict[str, Any]]) -> Tuple[List[Optional[Tuple[Dict[str, Any], bool, str]]], List[Dict[str, Any]]]:
+        """
+        Answer tweets from the tweet cache where possible.
+        
+        Args:
+            tweets: List of tweet dictionaries
+            
+        Returns:
+            Tuple of (results with None for each cache miss, tweets that missed)
+        """
+        cached_results = []
+        misses = []
+        
+        with self._tweet_cache_lock:
+            for tweet in tweets:
+                key = _tweet_cache_key(tweet.get('text', ''))
+                hit = self._tweet_cache.get(key)
+                if hit is None:
+                    cached_results.append(None)
+                    misses.append(tweet)
+                else:
+                    self._tweet_cache.move_to_end(key)
+                    cached_results.append((tweet, hit[0], hit[1]))
+                    
+        if len(misses) < len(tweets):
+            print(f"Tweet cache: {len(tweets) - len(misses)}/{len(tweets)} tweets served without an API call")
+        return cached_results, misses
+        
+    def _merge_cached_results(self, cached_results: List[Optional[Tuple[Dict[str, Any], bool, str]]],
+                              miss_results: List[Tuple[Dict[str, Any], bool, str]]) -> List[Tuple[Dict[str, Any], bool, str]]:
+        """
+        Cache fresh results and merge them back into input order.
+        
+        Args:
+            cached_results: Output of _split_cached_tweets, with None for each miss
+            miss_results: Results for the missed tweets, in order
+            
+        Returns:
+            List of tuples (tweet, is_pokemon, reply), in the original tweet order
+        """
+        with self._tweet_cache_lock:
+            # Only positive classifications are cached: a NO may be a failed or unparsed call
+            for tweet, is_pokemon, reply in miss_results:
+                if is_pokemon and reply:
+                    self._tweet_cache[_tweet_cache_key(tweet.get('text', ''))] = (is_pokemon, reply)
+            while len(self._tweet_cache) > TWEET_CACHE_SIZE:
+                self._tweet_cache.popitem(last=False)
+                
+        return self._fill_results(cached_results, miss_results)
+        
+    @staticmethod
+    def _fill_results(placeholders: List[Optional[Tuple[Dict[str, Any], bool, str]]],
+                      fresh_results: List[Tuple[Dict[str, Any], bool, str]]) -> List[Tuple[Dict[str, Any], bool, str]]:
+        """Fill each None placeholder, in order, with the next fresh result."""
+        fresh = iter(fresh_results)
+        return [result if result is not None else next(fresh) for result in placeholders]
         
     def _process_tweet_batch(self, tweets: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], bool, str]]:
         """
         Process a batch of tweets in a single API call.
         
+        If the call fails or the response is missing tweets, the batch is split in
+        half and each half retried as a batch; only a single tweet that still fails
+        falls back to the individual prompt.
+        
         Args:
             tweets: Batch of tweet dictionaries
             
@@ -204,87 +484,127 @@ class LLMManager:
         
         # Call LLM with the batch prompt
         try:
-            response = self.call_llm(prompt)
+            response = self.call_llm(prompt, system=BATCH_SYSTEM_PROMPT, json_mode=True)
             
+            # The API itself is failing; splitting the batch would only multiply calls
+            if response == LLM_ERROR_RESPONSE:
+                return [(tweet, False, "") for tweet in tweets]
+                
             # Parse the batch response
-            results = self._parse_batch_response(tweets, response)
-            return results
+            return self._parse_batch_response(tweets, response, strict=True)
             
         except Exception as e:
-            print(f"Error processing tweet batch: {str(e)}")
+            print(f"Error processing tweet batch of {len(tweets)}: {str(e)}")
             
-            # Fall back to individual processing if batch fails
+        if len(tweets) == 1:
             print("Falling back to individual tweet processing...")
-            results = []
+            return [self._process_individual_tweet(tweets[0])]
             
-            for tweet in tweets:
-                try:
-                    # Create individual prompt
-                    individual_prompt = self._create_individual_prompt(tweet['text'])
-                    
-                    # Call LLM
-                    response = self.call_llm(individual_prompt)
-                    
-                    # Parse response
-                    is_pokemon = 'POKEMON_RELATED: YES' in response
-                    reply = ""
-                    
-                    if is_pokemon:
-                        reply_match = re.search(r'REPLY: (.*?)($|POKEMON_RELATED:)', response, re.DOTALL)
-                        reply = reply_match.group(1).strip().strip('"').strip("'") if reply_match else "Interesting Pokémon card post! Trade safely on TradeUp!"
-                        
-                    results.append((tweet, is_pokemon, reply))
-                    
-                except Exception as e:
-                    print(f"Error processing individual tweet: {str(e)}")
-                    results.append((tweet, False, ""))
-                    
-            return results
+        mid = len(tweets) // 2
+        print(f"Retrying as batches of {mid} and {len(tweets) - mid} tweets...")
+        return self._process_tweet_batch(tweets[:mid]) + self._process_tweet_batch(tweets[mid:])
+        
+    def _process_individual_tweet(self, tweet: Dict[str, Any]) -> Tuple[Dict[str, Any], bool, str]:
+        """
+        Process a single tweet with its own API call.
+        
+        Args:
+            tweet: Tweet dictionary
             
-    def _create_batch_prompt(self, tweets: List[Dict[str, Any]]) -> str:
+        Returns:
+            Tuple (tweet, is_pokemon, reply)
         """
-        Create a prompt for batch processing multiple tweets.
+        try:
+            response = self.call_llm(self._create_individual_prompt(tweet['text']))
+            return self._parse_individual_response(tweet, response)
+        except Exception as e:
+            print(f"Error processing individual tweet: {str(e)}")
+            return (tweet, False, "")
+            
+    async def _aprocess_tweet_batch(self, tweets: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], bool, str]]:
+        """
+        Async version of _process_tweet_batch, bounded by the batch semaphore.
         
         Args:
-            tweets: List of tweet dictionaries
+            tweets: Batch of tweet dictionaries
             
         Returns:
-            Batch prompt string
+            List of tuples (tweet, is_pokemon, reply)
         """
-        prompt = """
-You are an AI assistant for TradeUp, a platform for trading Pokémon cards.
-
-I will provide you with multiple tweets. For each tweet, determine if it's related to Pokémon cards or the Pokémon Trading Card Game (TCG).
-
-For each tweet that IS related to Pokémon cards, write a friendly reply that:
-1. Reacts naturally to the tweet's content
-2. Adds a fun fact or mini price insight if relevant
-3. Ends with "Trade safely on TradeUp!"
-
-For tweets that are NOT related to Pokémon cards, simply indicate they are not relevant.
-
-Format your response using the exact format below, with one section per tweet:
-
-TWEET 1:
-POKEMON_RELATED: [YES/NO]
-REPLY: [Your reply text here]
-
-TWEET 2:
-POKEMON_RELATED: [YES/NO]
-REPLY: [Your reply text here]
-
-And so on for each tweet.
-
-Here are the tweets:
-
-"""
+        async with self._get_semaphore():
+            # Create a batch prompt with all tweets
+            prompt = self._create_batch_prompt(tweets)
+            
+            try:
+                response = await self.acall_llm(prompt, system=BATCH_SYSTEM_PROMPT, json_mode=True)
+                if response == LLM_ERROR_RESPONSE:
+                    return [(tweet, False, "") for tweet in tweets]
+                return self._parse_batch_response(tweets, response, strict=True)
+                
+            except Exception as e:
+                print(f"Error processing tweet batch of {len(tweets)}: {str(e)}")
+                
+        # Retries run outside the batch slot so the halves can overlap
+        if len(tweets) == 1:
+            print("Falling back to individual tweet processing...")
+            return [await self._aprocess_individual_tweet(tweets[0])]
+            
+        mid = len(tweets) // 2
+        print(f"Retrying as batches of {mid} and {len(tweets) - mid} tweets...")
+        left, right = await asyncio.gather(self._aprocess_tweet_batch(tweets[:mid]), self._aprocess_tweet_batch(tweets[mid:]))
+        return left + right
         
-        # Add each tweet to the prompt
-        for i, tweet in enumerate(tweets, 1):
-            tweet_text = tweet.get('text', '').strip()
-            prompt += f"TWEET {i}: {tweet_text}\n\n"
+    async def _aprocess_individual_tweet(self, tweet: Dict[str, Any]) -> Tuple[Dict[str, Any], bool, str]:
+        """
+        Async version of _process_individual_tweet.
+        
+        Args:
+            tweet: Tweet dictionary
+            
+        Returns:
+            Tuple (tweet, is_pokemon, reply)
+        """
+        try:
+            response = await self.acall_llm(self._create_individual_prompt(tweet['text']))
+            return self._parse_individual_response(tweet, response)
+        except Exception as e:
+            print(f"Error processing individual tweet: {str(e)}")
+            return (tweet, False, "")
+            
+    def _parse_individual_response(self, tweet: Dict[str, Any], response: str) -> Tuple[Dict[str, Any], bool, str]:
+        """
+        Parse the response from a single-tweet API call.
+        
+        Args:
+            tweet: Tweet dictionary
+            response: Response from the LLM
             
-        return prompt
+        Returns:
+            Tuple (tweet, is_pokemon, reply)
+        """
+        is_pokemon = 'POKEMON_RELATED: YES' in response
+        reply = ""
+        
+        if is_pokemon:
+            reply_match = _REPLY_RE.search(response)
+            reply = reply_match.group(1).strip().strip('"').strip("'") if reply_match else "Interesting Pokémon card post! Trade safely on TradeUp!"
+            
+        return (tweet, is_pokemon, reply)
+        
+    def _create_batch_prompt(self, tweets: List[Dict[str, Any]]) -> str:
+        """
+        Create the per-call user prompt for batch processing multiple tweets.
+        
+        Args:
+            tweets: List of tweet dictionaries
+            
+        Returns:
+            Batch prompt string, sent after BATCH_SYSTEM_PROMPT
+        """
+        # Static instructions live in BATCH_SYSTEM_PROMPT; only the tweets vary per call
+        parts = [BATCH_PROMPT_HEADER]
+        parts.extend(f"TWEET {i}: {tweet.get('text', '').strip()}\n\n" for i, tweet in enumerate(tweets, 1))
+        return "".join(parts)
         
     def _create_individual_prompt(self, tweet_text: str) -> str:
         """
@@ -315,22 +635,44 @@ POKEMON_RELATED: [YES/NO]
 REPLY: [Your reply text here]
 """
         
-    def _parse_batch_response(self, tweets: List[Dict[str, Any]], response: str) -> List[Tuple[Dict[str, Any], bool, str]]:
+    def _parse_batch_response(self, tweets: List[Dict[str, Any]], response: str,
+                              strict: bool = False) -> List[Tuple[Dict[str, Any], bool, str]]:
         """
-        Parse the response from a batch API call.
+        Parse the JSON response from a batch API call.
         
         Args:
             tweets: List of tweet dictionaries
             response: Response from the LLM
+            strict: Raise ValueError if any tweet is missing from the response
             
         Returns:
             List of tuples (tweet, is_pokemon, reply)
         """
-        results = []
+        try:
+            entries = json.loads(response)["tweets"]
+            parsed_results = {int(entry["i"]): (bool(entry.get("pokemon")), str(entry.get("reply") or "").strip()) for entry in entries}
+        except (ValueError, TypeError, KeyError) as e:
+            # Fall back to the plain-text format if the model didn't return valid JSON
+            print(f"Batch response was not valid JSON ({e}); parsing as text")
+            return self._parse_batch_text_response(tweets, response, strict)
+            
+        return self._map_batch_results(tweets, parsed_results, strict)
+        
+    def _parse_batch_text_response(self, tweets: List[Dict[str, Any]], response: str,
+                                   strict: bool = False) -> List[Tuple[Dict[str, Any], bool, str]]:
+        """
+        Parse a plain-text TWEET/POKEMON_RELATED/REPLY batch response.
         
+        Args:
+            tweets: List of tweet dictionaries
+            response: Response from the LLM
+            strict: Raise ValueError if any tweet is missing from the response
+            
+        Returns:
+            List of tuples (tweet, is_pokemon, reply)
+        """
         # Split the response into sections for each tweet
-        tweet_pattern = r'TWEET (\d+):\s*POKEMON_RELATED: (YES|NO)(?:\s*REPLY: (.*?))?(?=\s*TWEET \d+:|$)'
-        matches = re.finditer(tweet_pattern, response, re.DOTALL)
+        matches = _TWEET_RE.finditer(response)
         
         # Create a dictionary to store results by tweet number
         parsed_results = {}
@@ -342,11 +684,30 @@ REPLY: [Your reply text here]
             
             parsed_results[tweet_num] = (is_pokemon, reply)
             
+        return self._map_batch_results(tweets, parsed_results, strict)
+        
+    def _map_batch_results(self, tweets: List[Dict[str, Any]], parsed_results: Dict[int, Tuple[bool, str]],
+                           strict: bool = False) -> List[Tuple[Dict[str, Any], bool, str]]:
+        """
+        Map parsed results, keyed by 1-based tweet number, back to the original tweets.
+        
+        Args:
+            tweets: List of tweet dictionaries
+            parsed_results: Dictionary of tweet number -> (is_pokemon, reply)
+            strict: Raise ValueError if any tweet is missing from parsed_results
+            
+        Returns:
+            List of tuples (tweet, is_pokemon, reply)
+        """
+        results = []
+        
         # Map results back to original tweets
         for i, tweet in enumerate(tweets, 1):
             if i in parsed_results:
                 is_pokemon, reply = parsed_results[i]
                 results.append((tweet, is_pokemon, reply))
+            elif strict:
+                raise ValueError(f"No result found for tweet {i} in batch response")
             else:
                 # If no result for this tweet, assume it's not Pokémon-related
                 print(f"Warning: No result found for tweet {i} in batch response")
@@ -354,14 +715,18 @@ REPLY: [Your reply text here]
                 
         return results
 
-# Create a singleton instance
-try:
-    if OPENAI_API_KEY:
-        llm_manager = LLMManager()
-        print("✅ LLM Manager singleton created successfully")
-    else:
-        print("❌ Cannot create LLM Manager - no API key")
-        llm_manager = None
-except Exception as e:
-    print(f"❌ Failed to create LLM Manager: {e}")
-    llm_manager = None
\ No newline at end of file
+# Shared instance, created on first use so importing this module never builds API clients
+@lru_cache(maxsize=1)
+def get_llm_manager() -> LLMManager:
+    """
+    Return the shared LLM Manager, creating it on first call.
+    
+    Returns:
+        The LLMManager singleton
+        
+    Raises:
+        ValueError: If OPENAI_API_KEY is not configured; callers should stop asking after this
+    """
+    manager = LLMManager()
+    print("✅ LLM Manager singleton created successfully")
+    return manager
@@ -1,8 +1,12 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from uuid import uuid4
 from datetime import datetime, timedelta
 import logging
 import sys
@@ -17,29 +21,49 @@ import json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create FastAPI app
-app = FastAPI(title="Pokemon TCG Bot API")
+# Response "timestamp" fields only need second resolution, so format at most once a second
+_cached_timestamp = (0, "")
+
+def now_iso() -> str:
+    """Current time as an ISO string, cached for the rest of the current second"""
+    global _cached_timestamp
+    second = int(time.time())
+    if _cached_timestamp[0] != second:
+        _cached_timestamp = (second, datetime.now().isoformat())
+    return _cached_timestamp[1]
+
+# Create FastAPI app; responses are serialized with orjson instead of stdlib json
+app = FastAPI(title="Pokemon TCG Bot API", default_response_class=ORJSONResponse)
+
+# Simple CORS; the middleware also answers preflight OPTIONS requests.
+# Browsers reject credentialed requests against a wildcard origin, so credentials
+# are only allowed once explicit origins are configured.
+CORS_ALLOWED_ORIGINS = ["*"]
 
-# Simple CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=CORS_ALLOWED_ORIGINS,
+    allow_credentials=CORS_ALLOWED_ORIGINS != ["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight results for 24h
 )
 
-# Simple OPTIONS handler
-@app.options("/{rest_of_path:path}")
-async def preflight_handler(rest_of_path: str):
-    return JSONResponse(
-        content={},
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "*",
-            "Access-Control-Allow-Headers": "*",
-        }
-    )
+# Blocking calls (Twitter, Google Sheets) run in the threadpool; size it above the default 40
+THREADPOOL_SIZE = 100
+
+@app.on_event("startup")
+async def configure_threadpool():
+    """Raise the threadpool limit used by run_in_threadpool"""
+    try:
+        from anyio import to_thread
+        to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+        logger.info(f"🧵 Threadpool size set to {THREADPOOL_SIZE}")
+    except ImportError:
+        logger.warning("⚠️ anyio not available, keeping the default threadpool size")
+
+# Compress larger JSON payloads (post lists, queues, fetched tweets); small ones aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
 # Google Sheets configuration
 GOOGLE_SHEETS_URL = "https://docs.google.com/spreadsheets/d/1U50KjbsYUswh0IGWTPgeP97Y2kXRcYM_H1VoeyAQhpw/edit?gid=0#gid=0"
@@ -110,10 +134,25 @@ except Exception as e:
     logger.error(f"❌ Error importing Twitter poster: {e}")
     TWITTER_POSTER_AVAILABLE = False
 
+# Persistent bot jobs in jobs.db; jobs that were running before a restart are resumed at startup
+try:
+    from bot_manager import BotManager
+    bot_manager = BotManager()
+    logger.info("✅ Bot manager initialized")
+except Exception as e:
+    logger.error(f"❌ Error initializing bot manager: {e}")
+    bot_manager = None
+
+@app.on_event("startup")
+async def start_bot_manager():
+    """Resume bot jobs left running by the previous process"""
+    if bot_manager is not None:
+        await bot_manager.start()
+
 # Setup reply generation functions
 def setup_reply_functions():
     """Setup reply generation functions with error handling"""
-    global generate_reply
+    global generate_reply, agenerate_reply
     
     try:
         # Add current directory and subdirectories to path
@@ -150,20 +189,13 @@ def setup_reply_functions():
         # Try to import reply_generator
         logger.info("🔄 Attempting to import reply_generator...")
         from reply_generator import generate_reply as actual_generate_reply
+        from reply_generator import agenerate_reply as actual_agenerate_reply
         generate_reply = actual_generate_reply
+        agenerate_reply = actual_agenerate_reply
         logger.info("✅ Successfully imported reply_generator")
         
-        # Test the function
-        test_result = generate_reply("test tweet about Pokemon cards", "test_user")
-        logger.info(f"🧪 Test result: {test_result}")
-        
-        # Check if it's working properly
-        if isinstance(test_result, dict) and test_result.get("success", False):
-            logger.info("✅ Reply generation is working!")
-            return True
-        else:
-            logger.warning("⚠️ Reply generation imported but not working as expected")
-            return False
+        # The LLM Manager is created on the first request, so startup makes no test call
+        return True
         
     except ImportError as e:
         logger.error(f"❌ Import error: {e}")
@@ -185,6 +217,9 @@ def generate_reply(tweet_text, tweet_author=None, conversation_history=None):
         "error": "Reply generator not properly initialized"
     }
 
+async def agenerate_reply(tweet_text, tweet_author=None, conversation_history=None):
+    return generate_reply(tweet_text, tweet_author, conversation_history)
+
 # Try to setup reply generation
 logger.info("🚀 Setting up reply generation...")
 reply_setup_success = setup_reply_functions()
@@ -325,7 +360,7 @@ async def get_recent_posts():
             "success": True,
             "posts": recent_posts_storage,
             "count": len(recent_posts_storage),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -333,7 +368,7 @@ async def get_recent_posts():
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 # Job storage and management
@@ -581,21 +616,32 @@ async def get_bot_status():
     try:
         jobs = job_manager.get_all_jobs()
         
-        # Calculate total stats
-        total_posts_today = sum(job["stats"]["postsToday"] for job in jobs)
-        total_replies_today = sum(job["stats"]["repliesToday"] for job in jobs)
+        # Calculate total stats in a single pass over the jobs
+        running = False
+        last_run = None
+        total_posts_today = 0
+        total_replies_today = 0
+        for job in jobs:
+            stats = job.get("stats", {})
+            total_posts_today += stats.get("postsToday", 0)
+            total_replies_today += stats.get("repliesToday", 0)
+            if job.get("status") == "running":
+                running = True
+            job_last_run = job.get("lastRun")
+            if job_last_run and (last_run is None or job_last_run > last_run):
+                last_run = job_last_run
         
         return {
-            "running": any(job["status"] == "running" for job in jobs),
+            "running": running,
             "uptime": None,
-            "lastRun": max([job["lastRun"] for job in jobs if job["lastRun"]], default=None),
+            "lastRun": last_run,
             "stats": {
                 "postsToday": total_posts_today,
                 "repliesToday": total_replies_today,
                 "successRate": 95  # You can calculate this based on actual success/failure rates
             },
             "jobs": jobs,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -606,7 +652,7 @@ async def get_bot_status():
             "lastRun": None,
             "stats": {"postsToday": 0, "repliesToday": 0, "successRate": 0},
             "jobs": [],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 # Update your job management endpoints to use the real job manager
@@ -623,13 +669,13 @@ async def start_bot_job(job_id: str):
                 "message": f"Job {job_id} started successfully",
                 "job_id": job_id,
                 "status": job["status"] if job else "running",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         else:
             return {
                 "success": False,
                 "error": f"Job {job_id} not found or already running",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
     except Exception as e:
@@ -637,7 +683,7 @@ async def start_bot_job(job_id: str):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.post("/api/bot-job/{job_id}/stop")
@@ -652,13 +698,13 @@ async def stop_bot_job(job_id: str):
                 "message": f"Job {job_id} stopped successfully",
                 "job_id": job_id,
                 "status": "stopped",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         else:
             return {
                 "success": False,
                 "error": f"Job {job_id} not found",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
     except Exception as e:
@@ -666,7 +712,7 @@ async def stop_bot_job(job_id: str):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.post("/api/bot-job/{job_id}/pause")
@@ -681,13 +727,13 @@ async def pause_bot_job(job_id: str):
                 "message": f"Job {job_id} paused successfully", 
                 "job_id": job_id,
                 "status": "paused",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         else:
             return {
                 "success": False,
                 "error": f"Job {job_id} not found",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
     except Exception as e:
@@ -695,7 +741,7 @@ async def pause_bot_job(job_id: str):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.post("/api/bot-job/{job_id}/rename")
@@ -708,7 +754,7 @@ async def rename_bot_job(job_id: str, request: Dict[str, Any]):
             return {
                 "success": False,
                 "error": "Missing new name",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
         success = job_manager.rename_job(job_id, new_name)
@@ -719,13 +765,13 @@ async def rename_bot_job(job_id: str, request: Dict[str, Any]):
                 "message": f"Job {job_id} renamed to '{new_name}' successfully",
                 "job_id": job_id,
                 "new_name": new_name,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         else:
             return {
                 "success": False,
                 "error": f"Job {job_id} not found",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
     except Exception as e:
@@ -733,7 +779,7 @@ async def rename_bot_job(job_id: str, request: Dict[str, Any]):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.post("/api/bot-job/create-posting-job")
@@ -774,7 +820,7 @@ async def create_posting_job(request: Dict[str, Any]):
             "job_type": job_type,
             "content_count": len(approved_content),
             "settings": settings,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -782,7 +828,7 @@ async def create_posting_job(request: Dict[str, Any]):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.post("/api/bot-job/create-reply-job")
@@ -817,7 +863,7 @@ async def create_reply_job(request: Dict[str, Any]):
             "job_type": job_type,
             "max_replies_per_hour": max_replies_per_hour,
             "settings": settings,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -825,15 +871,112 @@ async def create_reply_job(request: Dict[str, Any]):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 #END RECENT POSTS STORAGE
 
 #POSTING FUNCTIONS - Updated with working endpoints from the original file
 
+# Results of posts handed off to background tasks, keyed by post_id
+background_posts = OrderedDict()
+MAX_BACKGROUND_POSTS = 100
+
+def _post_tweet(content: str, topics: List[str]) -> Dict[str, Any]:
+    """Post an original tweet (or simulate it) and record it in recent posts"""
+    if not TWITTER_POSTER_AVAILABLE or post_original_tweet is None:
+        logger.warning("🔄 Twitter poster not available, using simulation")
+        # Fallback to simulation
+        mock_tweet_id = f"sim_tweet_{int(time.time())}"
+        tweet_url = f"https://twitter.com/TradeUpApp/status/{mock_tweet_id}"
+        
+        # Add to recent posts even if simulated
+        add_to_recent_posts({
+            "tweet_id": mock_tweet_id,
+            "content": content,
+            "type": "post",
+            "tweet_url": tweet_url,
+            "topics": topics,
+            "posted_at": datetime.now().isoformat()
+        })
+        
+        return {
+            "success": True,
+            "tweet_id": mock_tweet_id,
+            "message": "Tweet posted successfully (simulated - Twitter poster not available)",
+            "tweet_url": tweet_url,
+            "content": content,
+            "simulated": True,
+            "timestamp": now_iso()
+        }
+    
+    # Use real Twitter API
+    logger.info("🐦 Using real Twitter API to post tweet...")
+    result = post_original_tweet(content)
+    
+    logger.info(f"🔍 Twitter API result: {result}")
+    
+    if result.get("success"):
+        tweet_id = result.get("tweet_id")
+        tweet_url = f"https://twitter.com/TradeUpApp/status/{tweet_id}"
+        logger.info(f"✅ Successfully posted tweet with ID: {tweet_id}")
+        
+        # Add to recent posts
+        add_to_recent_posts({
+            "tweet_id": tweet_id,
+            "content": content,
+            "type": "post",
+            "tweet_url": tweet_url,
+            "topics": topics,
+            "posted_at": datetime.now().isoformat()
+        })
+        
+        return {
+            "success": True,
+            "tweet_id": tweet_id,
+            "message": "Tweet posted successfully to Twitter",
+            "tweet_url": tweet_url,
+            "content": content,
+            "posted_at": datetime.now().isoformat(),
+            "simulated": False,
+            "timestamp": now_iso()
+        }
+    else:
+        logger.error(f"❌ Failed to post tweet: {result.get('error')}")
+        
+        return {
+            "success": False,
+            "error": result.get("error", "Unknown Twitter API error"),
+            "rate_limited": "Too Many Requests" in str(result.get("error", "")),
+            "timestamp": now_iso()
+        }
+
+def _prune_background_posts():
+    """Drop the oldest finished results over MAX_BACKGROUND_POSTS; pending posts are never evicted"""
+    excess = len(background_posts) - MAX_BACKGROUND_POSTS
+    if excess <= 0:
+        return
+    finished = [post_id for post_id, entry in background_posts.items() if entry.get("status") != "pending"]
+    for post_id in finished[:excess]:
+        del background_posts[post_id]
+
+async def _run_background_post(post_id: str, content: str, topics: List[str]):
+    """Run a queued post and store its result for polling"""
+    # Only the tweet itself goes to the threadpool; background_posts is only touched on the event loop
+    try:
+        result = await run_in_threadpool(_post_tweet, content, topics)
+    except Exception as e:
+        logger.error(f"❌ Error in background post {post_id}: {e}")
+        result = {
+            "success": False,
+            "error": str(e),
+            "timestamp": now_iso()
+        }
+    background_posts[post_id] = {**result, "post_id": post_id, "status": "completed"}
+    _prune_background_posts()
+
 @app.post("/api/post-to-twitter")
-async def post_to_twitter_endpoint(request: Dict[str, Any]):
+async def post_to_twitter_endpoint(request: Dict[str, Any], background_tasks: BackgroundTasks):
     """Post content to Twitter (original tweet) - this is what the frontend calls"""
     try:
         content = request.get("content", "")
@@ -846,84 +989,46 @@ async def post_to_twitter_endpoint(request: Dict[str, Any]):
             return {
                 "success": False,
                 "error": "Missing tweet content",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
-        if not TWITTER_POSTER_AVAILABLE or post_original_tweet is None:
-            logger.warning("🔄 Twitter poster not available, using simulation")
-            # Fallback to simulation
-            import time
-            mock_tweet_id = f"sim_tweet_{int(time.time())}"
-            tweet_url = f"https://twitter.com/TradeUpApp/status/{mock_tweet_id}"
-            
-            # Add to recent posts even if simulated
-            add_to_recent_posts({
-                "tweet_id": mock_tweet_id,
-                "content": content,
-                "type": "post",
-                "tweet_url": tweet_url,
-                "topics": topics,
-                "posted_at": datetime.now().isoformat()
-            })
+        # Opt-in: return immediately and let the client poll /api/post-to-twitter/{post_id}
+        if request.get("background"):
+            post_id = uuid4().hex
+            background_posts[post_id] = {"post_id": post_id, "status": "pending", "content": content}
+            _prune_background_posts()
+            background_tasks.add_task(_run_background_post, post_id, content, topics)
             
             return {
                 "success": True,
-                "tweet_id": mock_tweet_id,
-                "message": "Tweet posted successfully (simulated - Twitter poster not available)",
-                "tweet_url": tweet_url,
-                "content": content,
-                "simulated": True,
-                "timestamp": datetime.now().isoformat()
+                "accepted": True,
+                "post_id": post_id,
+                "status": "pending",
+                "timestamp": now_iso()
             }
         
-        # Use real Twitter API
-        logger.info("🐦 Using real Twitter API to post tweet...")
-        result = post_original_tweet(content)
-        
-        logger.info(f"🔍 Twitter API result: {result}")
-        
-        if result.get("success"):
-            tweet_id = result.get("tweet_id")
-            tweet_url = f"https://twitter.com/TradeUpApp/status/{tweet_id}"
-            logger.info(f"✅ Successfully posted tweet with ID: {tweet_id}")
-            
-            # Add to recent posts
-            add_to_recent_posts({
-                "tweet_id": tweet_id,
-                "content": content,
-                "type": "post",
-                "tweet_url": tweet_url,
-                "topics": topics,
-                "posted_at": datetime.now().isoformat()
-            })
-            
-            return {
-                "success": True,
-                "tweet_id": tweet_id,
-                "message": "Tweet posted successfully to Twitter",
-                "tweet_url": tweet_url,
-                "content": content,
-                "posted_at": datetime.now().isoformat(),
-                "simulated": False,
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            logger.error(f"❌ Failed to post tweet: {result.get('error')}")
-            
-            return {
-                "success": False,
-                "error": result.get("error", "Unknown Twitter API error"),
-                "rate_limited": "Too Many Requests" in str(result.get("error", "")),
-                "timestamp": datetime.now().isoformat()
-            }
+        # The Twitter client is blocking, so keep it off the event loop
+        return await run_in_threadpool(_post_tweet, content, topics)
         
     except Exception as e:
         logger.error(f"❌ Error in post_to_twitter_endpoint: {e}")
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
+        }
+
+@app.get("/api/post-to-twitter/{post_id}")
+async def get_background_post(post_id: str):
+    """Get the result of a post queued with background=true"""
+    result = background_posts.get(post_id)
+    if result is None:
+        return {
+            "success": False,
+            "error": f"Post {post_id} not found",
+            "timestamp": now_iso()
         }
+    return result
 
 @app.post("/api/generate-and-post-content")
 async def generate_and_post_content(request: Dict[str, Any]):
@@ -947,7 +1052,7 @@ async def generate_and_post_content(request: Dict[str, Any]):
             return {
                 "success": False,
                 "error": "Failed to generate content",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
         generated_content = content_result["content"]["content"]
@@ -965,16 +1070,14 @@ async def generate_and_post_content(request: Dict[str, Any]):
             "content_with_hashtags": content_with_hashtags,
             "hashtags": hashtags,
             "topic": topic,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
         # Post immediately if requested
         if post_immediately:
             logger.info("🚀 Posting generated content immediately...")
             
-            post_result = await post_to_twitter_endpoint({
-                "content": content_with_hashtags
-            })
+            post_result = await run_in_threadpool(_post_tweet, content_with_hashtags, [])
             
             response["post_result"] = post_result
             response["posted"] = post_result.get("success", False)
@@ -997,7 +1100,7 @@ async def generate_and_post_content(request: Dict[str, Any]):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.post("/api/post-scheduled-content")
@@ -1010,7 +1113,7 @@ async def post_scheduled_content(request: Dict[str, Any]):
             return {
                 "success": False,
                 "error": "No content items provided",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
         logger.info(f"📅 Posting {len(content_items)} scheduled content items...")
@@ -1036,8 +1139,8 @@ async def post_scheduled_content(request: Dict[str, Any]):
                 logger.info(f"⏰ Scheduled for: {scheduled_time}")
                 
                 if TWITTER_POSTER_AVAILABLE:
-                    # Use real Twitter API
-                    result = post_original_tweet(content)
+                    # Use real Twitter API (blocking client, so run it in the threadpool)
+                    result = await run_in_threadpool(post_original_tweet, content)
                     
                     if result.get("success"):
                         success_count += 1
@@ -1077,7 +1180,7 @@ async def post_scheduled_content(request: Dict[str, Any]):
                 # Small delay between posts to avoid rate limits
                 if i < len(content_items) - 1:  # Don't sleep after the last one
                     logger.info("⏰ Waiting 65 seconds between posts for rate limiting...")
-                    time.sleep(65)
+                    await asyncio.sleep(65)
                     
             except Exception as e:
                 logger.error(f"❌ Error posting content item {i+1}: {e}")
@@ -1094,7 +1197,7 @@ async def post_scheduled_content(request: Dict[str, Any]):
             "failed_posts": len(content_items) - success_count,
             "results": results,
             "twitter_available": TWITTER_POSTER_AVAILABLE,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -1102,7 +1205,7 @@ async def post_scheduled_content(request: Dict[str, Any]):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.get("/api/content-topics")
@@ -1158,7 +1261,7 @@ async def get_content_topics():
             "success": True,
             "topics": topics,
             "total": len(topics),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -1166,7 +1269,7 @@ async def get_content_topics():
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.get("/api/posting-queue")
@@ -1193,7 +1296,7 @@ async def get_posting_queue():
             "stats": stats,
             "can_post_now": stats.get("can_post_now", True),
             "next_available_post_time": None,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -1201,7 +1304,7 @@ async def get_posting_queue():
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 # Update your existing generate-content endpoint to support immediate posting
@@ -1236,7 +1339,7 @@ async def generate_content_enhanced(request: GenerateContentRequest):
                 "within_twitter_limit": len(full_content) <= 280
             },
             "posting_available": TWITTER_POSTER_AVAILABLE,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -1244,7 +1347,7 @@ async def generate_content_enhanced(request: GenerateContentRequest):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 #END POSTING FUNCTIONS
@@ -1256,7 +1359,7 @@ async def generate_content_endpoint(request: GenerateContentRequest):
         # For content generation, we can reuse the reply generator with a content prompt
         content_prompt = f"Generate an engaging Pokemon TCG social media post about {request.topic}. Make it authentic and interesting for the Pokemon TCG community."
         
-        result = generate_reply(content_prompt, "content_generator")
+        result = await agenerate_reply(content_prompt, "content_generator")
         
         if isinstance(result, dict) and result.get("success", False):
             content = result.get("content", "")
@@ -1283,7 +1386,7 @@ async def generate_content_endpoint(request: GenerateContentRequest):
                 "mentions_tradeup": False,
                 "reply_generator_used": reply_setup_success
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -1291,7 +1394,7 @@ async def generate_content_endpoint(request: GenerateContentRequest):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.post("/api/generate-reply")
@@ -1301,7 +1404,7 @@ async def generate_reply_endpoint(request: GenerateReplyRequest):
         logger.info(f"🤖 Generating reply for tweet: {request.tweet_text[:100]}...")
         
         # Generate reply using reply generator
-        result = generate_reply(
+        result = await agenerate_reply(
             request.tweet_text, 
             request.tweet_author, 
             request.conversation_history
@@ -1329,7 +1432,7 @@ async def generate_reply_endpoint(request: GenerateReplyRequest):
             "reply_generator_used": reply_setup_success,
             "llm_used": llm_used,
             "error": error,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -1339,7 +1442,7 @@ async def generate_reply_endpoint(request: GenerateReplyRequest):
             "error": str(e),
             "reply": "Sorry, I couldn't generate a reply right now.",
             "original_tweet": request.tweet_text,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.get("/api/fetch-tweets-from-sheets")
@@ -1404,7 +1507,7 @@ async def fetch_tweets_from_sheets():
                 "tweets": mock_tweets,
                 "count": len(mock_tweets),
                 "source": "Mock Data (Google Sheets reader not available)",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
         # Try to fetch real tweets from Google Sheets using automatic detection
@@ -1416,7 +1519,7 @@ async def fetch_tweets_from_sheets():
             raise Exception("Google Sheets functions not properly imported")
         
         # ✅ UPDATED: Use automatic detection - finds most recent sheet and reads from bottom up
-        tweets = get_tweets_from_most_recent_sheet(max_tweets=50, reverse_order=True)
+        tweets = await run_in_threadpool(get_tweets_from_most_recent_sheet, max_tweets=50, reverse_order=True)
         
         if not tweets:
             logger.warning("📊 No tweets found in Google Sheets, falling back to mock data")
@@ -1438,7 +1541,7 @@ async def fetch_tweets_from_sheets():
                 "tweets": mock_tweets,
                 "count": len(mock_tweets),
                 "source": "Mock Data (Google Sheets empty)",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
         logger.info(f"✅ Successfully fetched {len(tweets)} tweets from most recent Google Sheet")
@@ -1448,7 +1551,7 @@ async def fetch_tweets_from_sheets():
             "tweets": tweets,
             "count": len(tweets),
             "source": "Google Sheets (Most Recent Sheet - Bottom to Top)",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
@@ -1473,7 +1576,7 @@ async def fetch_tweets_from_sheets():
             "tweets": mock_tweets,  # Provide fallback tweets even on error
             "count": len(mock_tweets),
             "source": "Mock Data (Error Fallback)",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 @app.post("/api/post-reply-with-tracking")
@@ -1490,14 +1593,14 @@ async def post_reply_with_tracking_endpoint(request: Dict[str, Any]):
             return {
                 "success": False,
                 "error": "Missing reply content",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
         if not reply_to_tweet_id:
             return {
                 "success": False,
                 "error": "Missing reply_to_tweet_id",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
         # Get original tweet info from the request (if provided)
@@ -1534,12 +1637,12 @@ async def post_reply_with_tracking_endpoint(request: Dict[str, Any]):
                 "content": content,
                 "simulated": True,
                 "reply_to_tweet_id": reply_to_tweet_id,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
         # Use real Twitter API for reply
         logger.info("🐦 Using real Twitter API to post reply...")
-        result = post_reply_tweet(content, reply_to_tweet_id)
+        result = await run_in_threadpool(post_reply_tweet, content, reply_to_tweet_id)
         
         logger.info(f"🔍 Twitter API result: {result}")
         
@@ -1572,7 +1675,7 @@ async def post_reply_with_tracking_endpoint(request: Dict[str, Any]):
                 "reply_to_tweet_id": reply_to_tweet_id,
                 "posted_at": datetime.now().isoformat(),
                 "simulated": False,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         else:
             logger.error(f"❌ Failed to post reply: {result.get('error')}")
@@ -1581,7 +1684,7 @@ async def post_reply_with_tracking_endpoint(request: Dict[str, Any]):
                 "success": False,
                 "error": result.get("error", "Unknown Twitter API error"),
                 "rate_limited": "Too Many Requests" in str(result.get("error", "")),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         
     except Exception as e:
@@ -1589,10 +1692,12 @@ async def post_reply_with_tracking_endpoint(request: Dict[str, Any]):
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 if __name__ == "__main__":
     import uvicorn
     logger.info("🚀 Starting Pokemon TCG Bot API server...")
+    # loop/http default to "auto", which picks uvloop and httptools when installed.
+    # Keep a single worker: jobs, recent posts and queued posts live in process memory.
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
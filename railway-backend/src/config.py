@@ -3,10 +3,11 @@ Configuration settings for Pokemon TCG Bot Backend.
 """
 
 import os
+import logging
 from dotenv import load_dotenv
 from pathlib import Path
 
-# Load environment variables from .env file
+# Load environment variables from .env file; Python caches this module, so it runs once per process
 load_dotenv()
 
 # API Keys
@@ -15,29 +16,19 @@ TWITTER_API_SECRET = os.getenv('TWITTER_API_SECRET', '')
 TWITTER_ACCESS_TOKEN = os.getenv('TWITTER_ACCESS_TOKEN', '')
 TWITTER_ACCESS_SECRET = os.getenv('TWITTER_ACCESS_SECRET', '')
 
-print(f"API Key: {os.getenv('TWITTER_API_KEY')}")
-print(f"API Secret: {os.getenv('TWITTER_API_SECRET')}")  
-print(f"Access Token: {os.getenv('TWITTER_ACCESS_TOKEN')}")
-print(f"Access Secret: {os.getenv('TWITTER_ACCESS_SECRET')}")
-
 # LLM API Keys
 LLM_API_KEY = os.getenv('OPENAI_API_KEY', '')  # Default to OpenAI API key
 
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
 
-# Temporary debug - REMOVE after fixing
-import logging
-logging.basicConfig(level=logging.INFO)
+# Report whether keys are present, never their values
 logger = logging.getLogger(__name__)
 
-logger.info(f"🔑 OPENAI_API_KEY loaded: {'✅ Yes' if OPENAI_API_KEY else '❌ No'}")
+logger.info(f"🔑 Twitter credentials loaded: {'✅ Yes' if all((TWITTER_API_KEY, TWITTER_API_SECRET, TWITTER_ACCESS_TOKEN, TWITTER_ACCESS_SECRET)) else '❌ No'}")
 if OPENAI_API_KEY:
-    logger.info(f"🔑 Key length: {len(OPENAI_API_KEY)}")
-    logger.info(f"🔑 Key starts with: {OPENAI_API_KEY[:15]}...")
-    logger.info(f"🔑 Key ends with: ...{OPENAI_API_KEY[-10:]}")
+    logger.info("🔑 OPENAI_API_KEY loaded: ✅ Yes")
 else:
     logger.error("❌ No OPENAI_API_KEY found in environment")
-    logger.info(f"🔍 Available env vars with 'API': {[k for k in os.environ.keys() if 'API' in k]}")
 
 LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'openai')  # Default to OpenAI
 
@@ -53,8 +44,8 @@ LOGS_DIR.mkdir(exist_ok=True)
 # File paths
 REPLIED_TWEETS_LOG = LOGS_DIR / 'replied_tweets.csv'
 
-# Pokémon Keywords for content generation
-POKEMON_KEYWORDS = [
+# Pokémon Keywords for content generation (a tuple, so it can be sampled but not mutated)
+POKEMON_KEYWORDS = (
     "Pikachu", "Charizard", "Mewtwo", "Eternatus", "Arceus",
     "Pokémon TCG", "Booster Pack", "Elite Trainer Box", "Grading",
     "PSA 10", "BGS 9.5", "Collector", "Investment", "Rare Card",
@@ -68,4 +59,4 @@ POKEMON_KEYWORDS = [
     "Tournament", "Deck Building", "Strategy", "Meta", "TCG Live",
     "Opening Packs", "Pull Rates", "Binder Collection", "Slab",
     "Pop Report", "Market Price", "TCGplayer", "eBay", "TradeUp"
-]
+)
@@ -83,22 +83,24 @@ TRADEUP_REFERENCES = [
     "TradeUp's been buzzing for pulls like that."
 ]
 
+# Lowercase keywords mapped to the TRADEUP_REFERENCES that suit them, checked in order
+TRADEUP_REFERENCE_KEYWORDS = {
+    "trade": [0, 2, 3, 4, 8, 9, 15, 16, 17],
+    "list": [1, 5, 7, 18],
+    "sell": [14, 18],
+    "buy": [10, 11, 13],
+    "new": [16, 19],
+    "rare": [13, 19],
+    "collection": [6, 12],
+}
+
 def select_contextual_tradeup_reference(post_content):
     """Select TradeUp reference based on post context"""
-    keywords = {
-        "trade": [0, 2, 3, 4, 8, 9, 15, 16, 17],
-        "list": [1, 5, 7, 18],
-        "sell": [14, 18],
-        "buy": [10, 11, 13],
-        "new": [16, 19],
-        "rare": [13, 19],
-        "collection": [6, 12],
-    }
-    
     possible_indices = list(range(len(TRADEUP_REFERENCES)))
+    content_lower = post_content.lower()
     
-    for keyword, indices in keywords.items():
-        if keyword.lower() in post_content.lower():
+    for keyword, indices in TRADEUP_REFERENCE_KEYWORDS.items():
+        if keyword in content_lower:
             if indices:
                 possible_indices = indices + possible_indices
                 break
@@ -106,33 +108,39 @@ def select_contextual_tradeup_reference(post_content):
     selected_index = random.choice(possible_indices[:min(5, len(possible_indices))])
     return TRADEUP_REFERENCES[selected_index]
 
+# Template pools for the offline generator
+SIMPLE_TEMPLATES = (
+    "Just pulled a shiny {pokemon}! The artwork is incredible 🔥",
+    "Anyone else collecting {pokemon} cards? The market is hot right now 📈",
+    "That feeling when you get a perfect {pokemon} pull! #PokemonTCG 😍",
+    "Building a {pokemon} deck - the strategy options are endless ⚡",
+    "Found a gem: vintage {pokemon} card in mint condition! 💎",
+    "The {pokemon} alt art cards are absolutely stunning 🎨",
+    "PSA 10 {pokemon} prices climbing again! Investment potential 💰",
+    "New set features amazing {pokemon} artwork - must collect! ✨",
+    "Tournament ready with my {pokemon} deck build 🏆",
+    "Childhood nostalgia hits different with {pokemon} cards 🌟"
+)
+
+POKEMON_NAMES = (
+    'Charizard', 'Pikachu', 'Blastoise', 'Venusaur', 'Mewtwo', 'Mew',
+    'Lugia', 'Ho-Oh', 'Rayquaza', 'Dragonite', 'Gyarados', 'Snorlax',
+    'Eevee', 'Umbreon', 'Espeon', 'Alakazam', 'Gengar', 'Machamp'
+)
+
 def generate_simple_content(count=1, topic=None):
     """Fallback content generation using templates"""
     
-    templates = [
-        "Just pulled a shiny {pokemon}! The artwork is incredible 🔥",
-        "Anyone else collecting {pokemon} cards? The market is hot right now 📈",
-        "That feeling when you get a perfect {pokemon} pull! #PokemonTCG 😍",
-        "Building a {pokemon} deck - the strategy options are endless ⚡",
-        "Found a gem: vintage {pokemon} card in mint condition! 💎",
-        "The {pokemon} alt art cards are absolutely stunning 🎨",
-        "PSA 10 {pokemon} prices climbing again! Investment potential 💰",
-        "New set features amazing {pokemon} artwork - must collect! ✨",
-        "Tournament ready with my {pokemon} deck build 🏆",
-        "Childhood nostalgia hits different with {pokemon} cards 🌟"
-    ]
-    
-    pokemon_names = [
-        'Charizard', 'Pikachu', 'Blastoise', 'Venusaur', 'Mewtwo', 'Mew',
-        'Lugia', 'Ho-Oh', 'Rayquaza', 'Dragonite', 'Gyarados', 'Snorlax',
-        'Eevee', 'Umbreon', 'Espeon', 'Alakazam', 'Gengar', 'Machamp'
-    ]
+    # Sample distinct template/Pokemon pairs by index; only repeat once every pair is used
+    combinations = len(SIMPLE_TEMPLATES) * len(POKEMON_NAMES)
+    picks = []
+    while len(picks) < count:
+        picks.extend(random.sample(range(combinations), min(count - len(picks), combinations)))
     
     posts = []
-    for i in range(count):
-        template = random.choice(templates)
-        pokemon = random.choice(pokemon_names)
-        content = template.replace('{pokemon}', pokemon)
+    for pick in picks:
+        template_index, pokemon_index = divmod(pick, len(POKEMON_NAMES))
+        content = SIMPLE_TEMPLATES[template_index].replace('{pokemon}', POKEMON_NAMES[pokemon_index])
         
         posts.append({
             "post_content": content,
@@ -141,35 +149,8 @@ def generate_simple_content(count=1, topic=None):
     
     return posts
 
-def generate_advanced_content(count=1, topic=None):
-    """Advanced content generation with learning and knowledge integration"""
-    
-    try:
-        # Gather learning data
-        continuous_data = get_continuous_learning_data() if LEARNING_AVAILABLE else "Pokemon TCG collecting trends"
-        expert_prompt = generate_expert_knowledge_prompt() if KNOWLEDGE_AVAILABLE else "You are a Pokemon TCG expert."
-        knowledge_context = get_knowledge_for_content_generation() if KNOWLEDGE_AVAILABLE else "Popular: Charizard, Alt Arts, PSA grading"
-        
-        # Get feedback learning if available
-        learning_summary = ""
-        best_examples_text = ""
-        
-        if FEEDBACK_AVAILABLE and feedback_db:
-            try:
-                learning_summary = feedback_db.get_learning_summary(max_points=5)
-                best_examples = feedback_db.get_best_examples(count=3)
-                
-                if best_examples:
-                    best_examples_text = "Here are some examples of highly-rated posts:\n"
-                    for i, example in enumerate(best_examples):
-                        best_examples_text += f"{i+1}. \"{example}\"\n"
-                        
-                print(f"📚 Using {len(best_examples)} examples from feedback database")
-            except Exception as e:
-                print(f"⚠️ Feedback learning error: {e}")
-        
-        # Enhanced persona with learning
-        persona_guidelines = f"""
+# Static prompt scaffolding for generate_advanced_content, filled in per call
+ADVANCED_PERSONA_TEMPLATE = """
         {expert_prompt}
         
         You are TUPokePal, a knowledgeable and passionate Pokémon-card collector. 
@@ -181,9 +162,8 @@ def generate_advanced_content(count=1, topic=None):
         
         Current community context: {knowledge_context}
         """
-        
-        # Advanced prompt with all learning data
-        prompt = f"""
+
+ADVANCED_PROMPT_TEMPLATE = """
         As TUPokePal, generate {count} distinct social media posts about Pokémon cards. 
         Each post should be 1-2 sentences, max 200 characters, casual, friendly, and engaging. 
         Use one emoji per post (rotate 🔥 😍 🤩 😉 🐉 ⚡️). 
@@ -198,7 +178,7 @@ def generate_advanced_content(count=1, topic=None):
         {best_examples_text}
 
         If a manual topic is provided, strongly incorporate it into the posts. 
-        Manual Topic: {topic if topic else "None"}
+        Manual Topic: {topic}
 
         Each post should be unique and cover different aspects of Pokémon cards (e.g., fun facts, price trends, collector tips, new sets, specific cards, community questions).
         
@@ -225,6 +205,48 @@ def generate_advanced_content(count=1, topic=None):
             }}
         ]
         """
+
+def generate_advanced_content(count=1, topic=None):
+    """Advanced content generation with learning and knowledge integration"""
+    
+    try:
+        # Gather learning data
+        continuous_data = get_continuous_learning_data() if LEARNING_AVAILABLE else "Pokemon TCG collecting trends"
+        expert_prompt = generate_expert_knowledge_prompt() if KNOWLEDGE_AVAILABLE else "You are a Pokemon TCG expert."
+        knowledge_context = get_knowledge_for_content_generation() if KNOWLEDGE_AVAILABLE else "Popular: Charizard, Alt Arts, PSA grading"
+        
+        # Get feedback learning if available
+        learning_summary = ""
+        best_examples_text = ""
+        
+        if FEEDBACK_AVAILABLE and feedback_db:
+            try:
+                learning_summary = feedback_db.get_learning_summary(max_points=5)
+                best_examples = feedback_db.get_best_examples(count=3)
+                
+                if best_examples:
+                    best_examples_text = "Here are some examples of highly-rated posts:\n"
+                    for i, example in enumerate(best_examples):
+                        best_examples_text += f"{i+1}. \"{example}\"\n"
+                        
+                print(f"📚 Using {len(best_examples)} examples from feedback database")
+            except Exception as e:
+                print(f"⚠️ Feedback learning error: {e}")
+        
+        # Enhanced persona with learning
+        persona_guidelines = ADVANCED_PERSONA_TEMPLATE.format(
+            expert_prompt=expert_prompt,
+            knowledge_context=knowledge_context
+        )
+        
+        # Advanced prompt with all learning data
+        prompt = ADVANCED_PROMPT_TEMPLATE.format(
+            count=count,
+            continuous_data=continuous_data,
+            learning_summary=learning_summary,
+            best_examples_text=best_examples_text,
+            topic=topic if topic else "None"
+        )
         
         print(f"🧠 Using advanced generation with learning data")
         print(f"📊 Knowledge available: {KNOWLEDGE_AVAILABLE}")
@@ -262,6 +284,9 @@ def generate_advanced_content(count=1, topic=None):
     print("🔄 Falling back to simple content generation")
     return generate_simple_content(count, topic)
 
+# First JSON-array-looking span in a response that didn't parse as JSON outright
+JSON_ARRAY_RE = re.compile(r'\[.*?\]', re.DOTALL)
+
 def parse_llm_response(response_content):
     """
     Parses the LLM's response to extract individual posts.
@@ -281,7 +306,7 @@ def parse_llm_response(response_content):
 
     # Fallback for cases where LLM might not return perfect JSON
     # Try to find JSON-like structures within the response
-    json_match = re.search(r'\[.*?\]', response_content, re.DOTALL)
+    json_match = JSON_ARRAY_RE.search(response_content)
     if json_match:
         try:
             posts = json.loads(json_match.group(0))
@@ -292,7 +317,7 @@ def parse_llm_response(response_content):
 
     # If all else fails, try to split by common separators and create a single post
     # This is a last resort to ensure at least one post is returned
-    lines = [line.strip().strip('"').strip("'") for line in response_content.split('\n') if line.strip().strip('"').strip("'")]
+    lines = [line for line in (raw.strip().strip('"').strip("'") for raw in response_content.split('\n')) if line]
     if lines:
         content = " ".join(lines).strip().strip('"').strip("'").strip()
         tradeup_mentioned = "tradeup" in content.lower()
@@ -357,7 +382,8 @@ def generate_viral_content(count: int = 1, topic: str = None, keywords: list = N
     
     print(f"✅ Generated {len(posts)} posts")
     
-    # Convert to API format
+    # Convert to API format; the whole batch shares one timestamp
+    generated_at = datetime.now().isoformat()
     viral_posts = []
     for i, post in enumerate(posts):
         if isinstance(post, dict) and 'post_content' in post:
@@ -371,7 +397,7 @@ def generate_viral_content(count: int = 1, topic: str = None, keywords: list = N
                 "estimated_retweets": random.randint(8, 80),
                 "hashtags": hashtags,
                 "mentions_tradeup": post.get('tradeup_mention', False),
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": generated_at,
                 "topic": topic or "general",
                 "keywords": keywords or [],
                 "method": "advanced" if (LEARNING_AVAILABLE or FEEDBACK_AVAILABLE) else "basic",
@@ -391,7 +417,7 @@ def generate_viral_content(count: int = 1, topic: str = None, keywords: list = N
             "estimated_retweets": 5,
             "hashtags": [],
             "mentions_tradeup": False,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": generated_at,
             "topic": topic or "general",
             "keywords": keywords or [],
             "method": "placeholder"
@@ -455,14 +481,11 @@ def optimize_content_for_engagement(content: str) -> str:
     
     try:
         if FEEDBACK_AVAILABLE and feedback_db:
-            # Get insights from feedback database
-            learning_summary = feedback_db.get_learning_summary(max_points=3)
-            
             # Apply optimizations based on learning
             optimized = content
             
-            # Smart TradeUp mention based on feedback patterns
-            if "TradeUp" not in optimized and "tradeup" not in optimized.lower():
+            # Smart TradeUp mention based on feedback patterns; one lowercase scan covers any casing
+            if "tradeup" not in optimized.lower():
                 if random.random() < 0.2:  # 20% chance
                     tradeup_phrase = select_contextual_tradeup_reference(optimized)
                     optimized += " " + tradeup_phrase
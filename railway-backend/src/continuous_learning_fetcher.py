@@ -10,10 +10,13 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 # Google Sheet URL containing tweet examples
 TWEETS_SHEET_URL = "https://docs.google.com/spreadsheets/d/1U50KjbsYUswh0IGWTPgeP97Y2kXRcYM_H1VoeyAQhpw/edit?gid=0#gid=0"
 
+# One keep-alive session for PokeAPI so the list and detail lookups share a TLS connection
+POKEAPI_BASE_URL = "https://pokeapi.co/api/v2/"
+pokeapi_session = requests.Session()
+
 def fetch_pokeapi_data(endpoint):
-    base_url = "https://pokeapi.co/api/v2/"
     try:
-        response = requests.get(f"{base_url}{endpoint}", timeout=5)
+        response = pokeapi_session.get(f"{POKEAPI_BASE_URL}{endpoint}", timeout=5)
         response.raise_for_status()  # Raise an exception for HTTP errors
         logging.info(f"Successfully fetched data from PokeAPI endpoint: {endpoint}")
         return response.json()
@@ -120,12 +120,13 @@ class FeedbackDatabase:
         if post_metadata is None:
             post_metadata = {}
         
-        # Create a feedback entry
-        entry_id = f"feedback_{len(self.data['feedback_entries']) + 1}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        # Create a feedback entry; the id and timestamp come from the same clock read
+        now = datetime.now()
+        entry_id = f"feedback_{len(self.data['feedback_entries']) + 1}_{now.strftime('%Y%m%d%H%M%S')}"
         
         feedback_entry = {
             "id": entry_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "post_content": post_content,
             "feedback": feedback,
             "rating": rating,
@@ -164,7 +165,7 @@ class FeedbackDatabase:
                 "source_feedback_id": feedback_entry["id"],
                 "content": post_content,
                 "lesson": f"This post was rated {rating}/5. User feedback: {feedback_text}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": feedback_entry["timestamp"]
             }
             self.data["learning_points"].append(learning_point)
             
@@ -181,7 +182,7 @@ class FeedbackDatabase:
                 "source_feedback_id": feedback_entry["id"],
                 "content": post_content,
                 "lesson": f"This post was rated {rating}/5. User feedback: {feedback_text}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": feedback_entry["timestamp"]
             }
             self.data["learning_points"].append(learning_point)
         
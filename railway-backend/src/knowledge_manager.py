@@ -6,6 +6,7 @@ Railway-compatible version with proper path references.
 import os
 import json
 import datetime
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
@@ -22,80 +23,110 @@ PROCESSED_SOURCES_FILE = KNOWLEDGE_DIR / 'processed_sources.json'
 MEMORY_FILE = KNOWLEDGE_DIR / 'memory.json'
 MANUAL_INPUTS_FILE = KNOWLEDGE_DIR / 'manual_inputs.json'
 
+# orjson is much faster than the stdlib json module; fall back if it isn't installed
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+    
+    _loads = json.loads
+
+def _read_json(path: Path) -> Any:
+    """Parse a knowledge base JSON file."""
+    return _loads(path.read_bytes())
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write a knowledge base JSON file, replacing it atomically."""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_bytes(_dumps(data))
+    os.replace(tmp_path, path)
+
+# Files whose contents feed the generated prompts
+PROMPT_SOURCE_FILES = (COMMUNITY_TERMS_FILE, TRENDS_FILE, MEMORY_FILE)
+
+# Set once the files have been checked; they're only created here, never removed
+_knowledge_base_initialized = False
+
 def initialize_knowledge_base() -> None:
     """Initialize the knowledge base files if they don't exist."""
+    global _knowledge_base_initialized
+    if _knowledge_base_initialized:
+        return
+    
     # Ensure knowledge base directory exists
     KNOWLEDGE_DIR.mkdir(exist_ok=True)
     
     # Initialize community terms with Pokemon TCG terminology
     if not COMMUNITY_TERMS_FILE.exists():
-        with open(COMMUNITY_TERMS_FILE, 'w') as f:
-            json.dump({
-                "last_updated": datetime.datetime.now().isoformat(),
-                "terms": {
-                    "PSA": "Professional Sports Authenticator - grading company",
-                    "BGS": "Beckett Grading Services - grading company", 
-                    "WOTC": "Wizards of the Coast - original Pokemon TCG publisher",
-                    "Alt Art": "Alternative artwork version of a card",
-                    "Rainbow Rare": "Special rainbow foil treatment on cards",
-                    "Chase Card": "Highly sought after card in a set",
-                    "Raw": "Ungraded card",
-                    "Slab": "Graded card in protective case",
-                    "Zard": "Community nickname for Charizard",
-                    "Pop Report": "Population report showing how many cards have been graded",
-                    "SWSH": "Sword & Shield series",
-                    "VMAX": "Pokemon VMAX card type",
-                    "GX": "Pokemon GX card type",
-                    "EX": "Pokemon EX card type"
-                }
-            }, f, indent=2)
+        _write_json(COMMUNITY_TERMS_FILE, {
+            "last_updated": datetime.datetime.now().isoformat(),
+            "terms": {
+                "PSA": "Professional Sports Authenticator - grading company",
+                "BGS": "Beckett Grading Services - grading company", 
+                "WOTC": "Wizards of the Coast - original Pokemon TCG publisher",
+                "Alt Art": "Alternative artwork version of a card",
+                "Rainbow Rare": "Special rainbow foil treatment on cards",
+                "Chase Card": "Highly sought after card in a set",
+                "Raw": "Ungraded card",
+                "Slab": "Graded card in protective case",
+                "Zard": "Community nickname for Charizard",
+                "Pop Report": "Population report showing how many cards have been graded",
+                "SWSH": "Sword & Shield series",
+                "VMAX": "Pokemon VMAX card type",
+                "GX": "Pokemon GX card type",
+                "EX": "Pokemon EX card type"
+            }
+        })
     
     # Initialize trends with Pokemon TCG trends
     if not TRENDS_FILE.exists():
-        with open(TRENDS_FILE, 'w') as f:
-            json.dump({
-                "last_updated": datetime.datetime.now().isoformat(),
-                "trends": [
-                    {"topic": "Charizard prices", "score": 95, "category": "market"},
-                    {"topic": "PSA 10 grading", "score": 88, "category": "collecting"},
-                    {"topic": "Vintage WOTC cards", "score": 82, "category": "vintage"},
-                    {"topic": "Alt Art cards", "score": 78, "category": "modern"},
-                    {"topic": "Japanese cards", "score": 75, "category": "international"},
-                    {"topic": "Tournament results", "score": 70, "category": "competitive"}
-                ]
-            }, f, indent=2)
+        _write_json(TRENDS_FILE, {
+            "last_updated": datetime.datetime.now().isoformat(),
+            "trends": [
+                {"topic": "Charizard prices", "score": 95, "category": "market"},
+                {"topic": "PSA 10 grading", "score": 88, "category": "collecting"},
+                {"topic": "Vintage WOTC cards", "score": 82, "category": "vintage"},
+                {"topic": "Alt Art cards", "score": 78, "category": "modern"},
+                {"topic": "Japanese cards", "score": 75, "category": "international"},
+                {"topic": "Tournament results", "score": 70, "category": "competitive"}
+            ]
+        })
     
     # Initialize news
     if not NEWS_FILE.exists():
-        with open(NEWS_FILE, 'w') as f:
-            json.dump({
-                "last_updated": datetime.datetime.now().isoformat(),
-                "news": []
-            }, f, indent=2)
+        _write_json(NEWS_FILE, {
+            "last_updated": datetime.datetime.now().isoformat(),
+            "news": []
+        })
     
     # Initialize processed sources
     if not PROCESSED_SOURCES_FILE.exists():
-        with open(PROCESSED_SOURCES_FILE, 'w') as f:
-            json.dump({
-                "csv_files": [],
-                "web_scrapes": []
-            }, f, indent=2)
+        _write_json(PROCESSED_SOURCES_FILE, {
+            "csv_files": [],
+            "web_scrapes": []
+        })
     
     # Initialize memory
     if not MEMORY_FILE.exists():
-        with open(MEMORY_FILE, 'w') as f:
-            json.dump({
-                "last_updated": datetime.datetime.now().isoformat(),
-                "memories": []
-            }, f, indent=2)
+        _write_json(MEMORY_FILE, {
+            "last_updated": datetime.datetime.now().isoformat(),
+            "memories": []
+        })
     
     # Initialize manual inputs
     if not MANUAL_INPUTS_FILE.exists():
-        with open(MANUAL_INPUTS_FILE, 'w') as f:
-            json.dump({
-                "last_updated": datetime.datetime.now().isoformat(),
-                "inputs": []
-            }, f, indent=2)
+        _write_json(MANUAL_INPUTS_FILE, {
+            "last_updated": datetime.datetime.now().isoformat(),
+            "inputs": []
+        })
+    
+    _knowledge_base_initialized = True
 
 def load_knowledge_base() -> Dict[str, Any]:
     """Load the entire knowledge base."""
@@ -104,36 +135,31 @@ def load_knowledge_base() -> Dict[str, Any]:
     knowledge = {}
     
     try:
-        with open(COMMUNITY_TERMS_FILE, 'r') as f:
-            knowledge['community_terms'] = json.load(f)
+        knowledge['community_terms'] = _read_json(COMMUNITY_TERMS_FILE)
     except Exception as e:
         print(f"Error loading community terms: {e}")
         knowledge['community_terms'] = {"terms": {}}
     
     try:
-        with open(TRENDS_FILE, 'r') as f:
-            knowledge['trends'] = json.load(f)
+        knowledge['trends'] = _read_json(TRENDS_FILE)
     except Exception as e:
         print(f"Error loading trends: {e}")
         knowledge['trends'] = {"trends": []}
     
     try:
-        with open(NEWS_FILE, 'r') as f:
-            knowledge['news'] = json.load(f)
+        knowledge['news'] = _read_json(NEWS_FILE)
     except Exception as e:
         print(f"Error loading news: {e}")
         knowledge['news'] = {"news": []}
     
     try:
-        with open(MEMORY_FILE, 'r') as f:
-            knowledge['memory'] = json.load(f)
+        knowledge['memory'] = _read_json(MEMORY_FILE)
     except Exception as e:
         print(f"Error loading memory: {e}")
         knowledge['memory'] = {"memories": []}
     
     try:
-        with open(MANUAL_INPUTS_FILE, 'r') as f:
-            knowledge['manual_inputs'] = json.load(f)
+        knowledge['manual_inputs'] = _read_json(MANUAL_INPUTS_FILE)
     except Exception as e:
         print(f"Error loading manual inputs: {e}")
         knowledge['manual_inputs'] = {"inputs": []}
@@ -149,8 +175,7 @@ def update_knowledge_base_from_csv(csv_path: str) -> None:
     
     try:
         # Load processed sources
-        with open(PROCESSED_SOURCES_FILE, 'r') as f:
-            processed = json.load(f)
+        processed = _read_json(PROCESSED_SOURCES_FILE)
         
         # Add this CSV to processed list if not already there
         if csv_path not in [p.get("path", "") for p in processed.get("csv_files", [])]:
@@ -160,8 +185,7 @@ def update_knowledge_base_from_csv(csv_path: str) -> None:
             })
             
             # Save updated processed sources
-            with open(PROCESSED_SOURCES_FILE, 'w') as f:
-                json.dump(processed, f, indent=2)
+            _write_json(PROCESSED_SOURCES_FILE, processed)
         
         print(f"Successfully processed CSV: {csv_path}")
         
@@ -177,8 +201,7 @@ def update_knowledge_base_from_web() -> None:
     
     try:
         # Load processed sources
-        with open(PROCESSED_SOURCES_FILE, 'r') as f:
-            processed = json.load(f)
+        processed = _read_json(PROCESSED_SOURCES_FILE)
         
         # Add web scrape record
         processed.setdefault("web_scrapes", []).append({
@@ -187,57 +210,97 @@ def update_knowledge_base_from_web() -> None:
         })
         
         # Save updated processed sources
-        with open(PROCESSED_SOURCES_FILE, 'w') as f:
-            json.dump(processed, f, indent=2)
+        _write_json(PROCESSED_SOURCES_FILE, processed)
         
         print("Successfully updated knowledge base from web sources")
         
     except Exception as e:
         print(f"Error updating from web sources: {e}")
 
+# Parsed memory.json, newest first, with the file signature it was read at
+_memory_cache: Optional[tuple] = None
+
+MAX_MEMORIES = 100
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    """Modification time and size of a file, or None if it can't be read."""
+    try:
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+def _load_memory_data() -> Dict[str, Any]:
+    """Return the memory data, re-reading memory.json only if it changed on disk."""
+    global _memory_cache
+    
+    signature = _file_signature(MEMORY_FILE)
+    if _memory_cache is not None and _memory_cache[0] == signature:
+        return _memory_cache[1]
+    
+    try:
+        memory_data = _read_json(MEMORY_FILE)
+    except (FileNotFoundError, ValueError):
+        memory_data = {
+            "last_updated": datetime.datetime.now().isoformat(),
+            "memories": []
+        }
+    
+    # Sort once on load; add_memory keeps the list newest first from then on
+    memory_data["memories"] = sorted(
+        memory_data.get("memories", []),
+        key=lambda x: x.get("date", ""),
+        reverse=True
+    )[:MAX_MEMORIES]
+    
+    _memory_cache = (signature, memory_data)
+    return memory_data
+
 def add_memory(content: str, source: str) -> None:
     """Add a memory to the knowledge base."""
+    global _memory_cache
+    
     try:
         initialize_knowledge_base()
         
         # Load memory file
-        try:
-            with open(MEMORY_FILE, 'r') as f:
-                memory_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            memory_data = {
-                "last_updated": datetime.datetime.now().isoformat(),
-                "memories": []
-            }
+        memory_data = _load_memory_data()
+        now = datetime.datetime.now().isoformat()
         
-        # Add new memory
-        memory_data["memories"].append({
+        # Add new memory; it is the newest, so it goes first and the oldest drop off the end
+        memories = memory_data["memories"]
+        memories.insert(0, {
             "content": content,
             "source": source,
-            "date": datetime.datetime.now().isoformat()
+            "date": now
         })
-        
-        # Limit to 100 most recent memories
-        memory_data["memories"] = sorted(
-            memory_data["memories"], 
-            key=lambda x: x.get("date", ""), 
-            reverse=True
-        )[:100]
+        del memories[MAX_MEMORIES:]
         
         # Update timestamp
-        memory_data["last_updated"] = datetime.datetime.now().isoformat()
+        memory_data["last_updated"] = now
         
         # Save updated memories
-        with open(MEMORY_FILE, 'w') as f:
-            json.dump(memory_data, f, indent=2)
+        _write_json(MEMORY_FILE, memory_data)
+        _memory_cache = (_file_signature(MEMORY_FILE), memory_data)
             
         print(f"Added memory from {source}: {content[:50]}...")
         
     except Exception as e:
+        _memory_cache = None
         print(f"Error adding memory: {e}")
 
+def _knowledge_signature() -> tuple:
+    """Modification time and size of each prompt source file, used as a cache key."""
+    return tuple(_file_signature(path) for path in PROMPT_SOURCE_FILES)
+
 def generate_expert_knowledge_prompt() -> str:
     """Generate an expert knowledge prompt based on the current knowledge base."""
+    # Rebuilt only when one of the knowledge files has changed
+    return _build_expert_knowledge_prompt(_knowledge_signature())
+
+@lru_cache(maxsize=1)
+def _build_expert_knowledge_prompt(signature: tuple) -> str:
+    """Build the expert knowledge prompt for the given knowledge base state."""
     
     # Load current knowledge
     knowledge = load_knowledge_base()
@@ -295,6 +358,11 @@ Your content should reflect this expert knowledge while maintaining an engaging,
 
 def get_knowledge_for_content_generation() -> str:
     """Get relevant knowledge for content generation in a concise format."""
+    return _build_content_knowledge(_knowledge_signature())
+
+@lru_cache(maxsize=1)
+def _build_content_knowledge(signature: tuple) -> str:
+    """Build the content generation knowledge summary for the given knowledge base state."""
     knowledge = load_knowledge_base()
     
     # Combine trending topics and recent insights
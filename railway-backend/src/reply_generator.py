@@ -5,6 +5,7 @@ Generates custom replies to tweets from the Google Sheet using LLM Manager.
 
 import os
 import sys
+import asyncio
 import random
 import json
 import logging
@@ -20,27 +21,36 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-# Try to import LLM Manager with error handling
+# Try to import LLM Manager with error handling; the manager itself is created on first use
 try:
-    from llm_manager import LLMManager
-    
-    # Initialize the LLM Manager
-    llm_manager = LLMManager()
+    from llm_manager import get_llm_manager
     LLM_MANAGER_AVAILABLE = True
-    logging.info("✅ Successfully imported and initialized LLM Manager")
-    
-    # Debug: List all available methods
-    available_methods = [method for method in dir(llm_manager) if not method.startswith('_') and callable(getattr(llm_manager, method))]
-    logging.info(f"🔍 Available LLM Manager methods: {available_methods}")
+    logging.info("✅ Successfully imported LLM Manager")
     
 except ImportError as e:
     logging.error(f"❌ Failed to import LLM Manager: {e}")
     LLM_MANAGER_AVAILABLE = False
-    llm_manager = None
 except Exception as e:
-    logging.error(f"❌ Failed to initialize LLM Manager: {e}")
+    logging.error(f"❌ Failed to import LLM Manager: {e}")
     LLM_MANAGER_AVAILABLE = False
-    llm_manager = None
+
+def _get_llm_manager():
+    """
+    Get the shared LLM Manager, creating it on first use.
+    
+    Returns:
+        The LLMManager instance, or None if it is unavailable
+    """
+    global LLM_MANAGER_AVAILABLE
+    if not LLM_MANAGER_AVAILABLE:
+        return None
+    try:
+        return get_llm_manager()
+    except Exception as e:
+        # Initialization failures are permanent, so log once and use fallbacks from here on
+        logging.error(f"❌ Failed to initialize LLM Manager: {e}")
+        LLM_MANAGER_AVAILABLE = False
+        return None
 
 def create_custom_reply_prompt(tweet_content, username=None):
     """
@@ -84,6 +94,50 @@ POKEMON_RELATED: YES
 REPLY: [Your reply text here]
 """
 
+# Replies used when the LLM answers but the REPLY line can't be parsed
+PARSE_FALLBACK_REPLIES = [
+    "That's a sweet card! What's your favorite pull recently? 🔥",
+    "Nice! The Pokemon TCG market has been wild lately 😍",
+    "Love seeing fellow collectors! Any chase cards you're hunting? 🤩",
+    "That pull though! Have you considered grading it? ✨"
+]
+
+# Replies used when the LLM call itself fails
+ERROR_FALLBACK_REPLIES = [
+    "Awesome Pokemon card content! What's your favorite card in your collection? 🔥",
+    "That's a sweet pull! The Pokemon TCG community is the best 😍",
+    "Love seeing fellow collectors share their pulls! 🤩",
+    "Great content! What deck are you building next? ⚡️"
+]
+
+def parse_reply_response(response):
+    """
+    Extract the reply text from an LLM response.
+    
+    Args:
+        response: Raw LLM response text
+        
+    Returns:
+        Cleaned reply content, or a fallback reply if parsing fails
+    """
+    # Parse the response to extract the reply
+    if "REPLY:" in response:
+        reply_match = re.search(r'REPLY:\s*(.*?)$', response, re.DOTALL)
+        if reply_match:
+            reply_content = reply_match.group(1).strip().strip('"').strip("'")
+            # Clean up any extra formatting
+            reply_content = reply_content.replace('\n', ' ').strip().strip('"').strip("'")
+            
+            # Remove any trailing text that might be cut off
+            reply_content = reply_content.split('\n')[0].strip().strip('"').strip("'")
+            
+            logging.info(f"✅ Generated reply: {reply_content}")
+            return reply_content
+    
+    # Fallback if parsing fails
+    logging.warning("⚠️ Failed to parse LLM response, using fallback")
+    return random.choice(PARSE_FALLBACK_REPLIES)
+
 def generate_reply_content(tweet_content, username=None):
     """
     Generate a custom reply to a tweet using the LLM Manager.
@@ -99,50 +153,92 @@ def generate_reply_content(tweet_content, username=None):
         # Create the customized prompt
         prompt = create_custom_reply_prompt(tweet_content, username)
         
-        if LLM_MANAGER_AVAILABLE and llm_manager:
+        llm_manager = _get_llm_manager()
+        if llm_manager:
             # Use LLM Manager to generate the response
             logging.info("🤖 Using LLM Manager for reply generation")
-            response = llm_manager.call_llm(prompt, model="gpt-3.5-turbo")
+            response = llm_manager.call_llm(prompt)
             logging.info(f"📝 LLM response received: {response[:100]}...")
         else:
             # Fallback if LLM Manager is not available
             logging.warning("🔄 LLM Manager not available, using fallback")
             raise Exception("LLM Manager not available")
         
-        # Parse the response to extract the reply
-        if "REPLY:" in response:
-            reply_match = re.search(r'REPLY:\s*(.*?)$', response, re.DOTALL)
-            if reply_match:
-                reply_content = reply_match.group(1).strip().strip('"').strip("'")
-                # Clean up any extra formatting
-                reply_content = reply_content.replace('\n', ' ').strip().strip('"').strip("'")
-                
-                # Remove any trailing text that might be cut off
-                reply_content = reply_content.split('\n')[0].strip().strip('"').strip("'")
-                
-                logging.info(f"✅ Generated reply: {reply_content}")
-                return reply_content
-        
-        # Fallback if parsing fails
-        logging.warning("⚠️ Failed to parse LLM response, using fallback")
-        fallback_replies = [
-            "That's a sweet card! What's your favorite pull recently? 🔥",
-            "Nice! The Pokemon TCG market has been wild lately 😍",
-            "Love seeing fellow collectors! Any chase cards you're hunting? 🤩",
-            "That pull though! Have you considered grading it? ✨"
-        ]
-        return random.choice(fallback_replies)
+        return parse_reply_response(response)
 
     except Exception as e:
         logging.error(f"❌ Error generating reply content: {e}")
         # Return a safe fallback reply
-        fallback_replies = [
-            "Awesome Pokemon card content! What's your favorite card in your collection? 🔥",
-            "That's a sweet pull! The Pokemon TCG community is the best 😍",
-            "Love seeing fellow collectors share their pulls! 🤩",
-            "Great content! What deck are you building next? ⚡️"
-        ]
-        return random.choice(fallback_replies)
+        return random.choice(ERROR_FALLBACK_REPLIES)
+
+async def agenerate_reply_content(tweet_content, username=None):
+    """
+    Async version of generate_reply_content that awaits the LLM call.
+    
+    Args:
+        tweet_content: Content of the tweet to reply to
+        username: Username of the tweet author (if available)
+        
+    Returns:
+        Generated reply content
+    """
+    try:
+        prompt = create_custom_reply_prompt(tweet_content, username)
+        
+        llm_manager = _get_llm_manager()
+        if llm_manager:
+            logging.info("🤖 Using LLM Manager for reply generation")
+            response = await llm_manager.acall_llm(prompt)
+            logging.info(f"📝 LLM response received: {response[:100]}...")
+        else:
+            logging.warning("🔄 LLM Manager not available, using fallback")
+            raise Exception("LLM Manager not available")
+        
+        return parse_reply_response(response)
+
+    except Exception as e:
+        logging.error(f"❌ Error generating reply content: {e}")
+        return random.choice(ERROR_FALLBACK_REPLIES)
+
+def _build_reply_result(reply_content):
+    """
+    Wrap generated reply content in the FastAPI response format.
+    
+    Args:
+        reply_content: Generated reply text
+        
+    Returns:
+        Dictionary with reply content and success status
+    """
+    # Determine if we actually used the LLM successfully
+    llm_used = _get_llm_manager() is not None
+    
+    # Check if the reply looks like it was actually generated (not a fallback)
+    is_fallback = any(fallback in reply_content for fallback in [
+        "Awesome Pokemon card content!",
+        "That's a sweet pull!",
+        "Love seeing fellow collectors share their pulls!",
+        "Great content! What deck are you building next?"
+    ])
+    
+    success = llm_used and not is_fallback
+    
+    return {
+        "content": reply_content,
+        "success": success,
+        "llm_used": llm_used,
+        "is_fallback": is_fallback
+    }
+
+def _reply_error_result(error):
+    """Build the fallback response returned when reply generation raises."""
+    return {
+        "content": "Thanks for sharing! Great Pokemon TCG content. 🔥",
+        "success": False,
+        "error": str(error),
+        "llm_used": False,
+        "is_fallback": True
+    }
 
 def generate_reply(tweet_text, tweet_author=None, conversation_history=None):
     """
@@ -161,35 +257,77 @@ def generate_reply(tweet_text, tweet_author=None, conversation_history=None):
         logging.info(f"👤 Author: {tweet_author}")
         
         reply_content = generate_reply_content(tweet_text, tweet_author)
+        return _build_reply_result(reply_content)
+    except Exception as e:
+        logging.error(f"❌ Error in generate_reply: {e}")
+        return _reply_error_result(e)
+
+async def agenerate_reply(tweet_text, tweet_author=None, conversation_history=None):
+    """
+    Async version of generate_reply for use inside FastAPI endpoints.
+    
+    Args:
+        tweet_text: Content of the tweet to reply to
+        tweet_author: Username of the tweet author (optional)
+        conversation_history: Previous conversation context (optional, not used currently)
         
-        # Determine if we actually used the LLM successfully
-        llm_used = LLM_MANAGER_AVAILABLE and llm_manager is not None
+    Returns:
+        Dictionary with reply content and success status
+    """
+    try:
+        logging.info(f"🎯 Generating reply for tweet: {tweet_text[:100]}...")
+        logging.info(f"👤 Author: {tweet_author}")
         
-        # Check if the reply looks like it was actually generated (not a fallback)
-        is_fallback = any(fallback in reply_content for fallback in [
-            "Awesome Pokemon card content!",
-            "That's a sweet pull!",
-            "Love seeing fellow collectors share their pulls!",
-            "Great content! What deck are you building next?"
-        ])
+        reply_content = await agenerate_reply_content(tweet_text, tweet_author)
+        return _build_reply_result(reply_content)
+    except Exception as e:
+        logging.error(f"❌ Error in agenerate_reply: {e}")
+        return _reply_error_result(e)
+
+def _format_batch_tweets(tweets_data):
+    """Convert tweets to the format expected by LLM Manager's batch processing."""
+    formatted_tweets = []
+    for tweet in tweets_data:
+        formatted_tweet = {
+            'text': tweet.get('tweet_content', tweet.get('text', '')),
+            'id': tweet.get('tweet_id', tweet.get('id', '')),
+            'username': tweet.get('username', tweet.get('author', '')),
+            'url': tweet.get('url', '')
+        }
+        formatted_tweets.append(formatted_tweet)
+    return formatted_tweets
+
+def _build_batch_results(tweets_data, batch_results):
+    """
+    Shape LLM Manager batch results for the API.
+    
+    Args:
+        tweets_data: List of tweet dictionaries, in the order they were sent
+        batch_results: List of tuples (tweet, is_pokemon, reply) from LLM Manager
         
-        success = llm_used and not is_fallback
+    Returns:
+        List of results with generated replies
+    """
+    results = []
+    for i, (tweet, is_pokemon, reply) in enumerate(batch_results):
+        original_tweet_data = tweets_data[i]
         
-        return {
-            "content": reply_content,
-            "success": success,
-            "llm_used": llm_used,
-            "is_fallback": is_fallback
-        }
-    except Exception as e:
-        logging.error(f"❌ Error in generate_reply: {e}")
-        return {
-            "content": "Thanks for sharing! Great Pokemon TCG content. 🔥",
-            "success": False,
-            "error": str(e),
-            "llm_used": False,
-            "is_fallback": True
+        result = {
+            'original_tweet': original_tweet_data.get('tweet_content', original_tweet_data.get('text', '')),
+            'username': original_tweet_data.get('username', original_tweet_data.get('author', '')),
+            'tweet_id': original_tweet_data.get('tweet_id', original_tweet_data.get('id', '')),
+            'tweet_url': original_tweet_data.get('url', ''),
+            'reply_content': reply if reply else "Great Pokemon content! 🔥",
+            'success': bool(is_pokemon and reply),
+            'is_pokemon_related': is_pokemon,
+            'posted': False,
+            'llm_used': True
         }
+        
+        results.append(result)
+    
+    logging.info(f"✅ Batch processing complete: {len(results)} replies generated")
+    return results
 
 def batch_generate_replies(tweets_data):
     """
@@ -202,45 +340,13 @@ def batch_generate_replies(tweets_data):
         List of results with generated replies
     """
     try:
-        if LLM_MANAGER_AVAILABLE and llm_manager and hasattr(llm_manager, 'batch_process_tweets'):
+        llm_manager = _get_llm_manager()
+        if llm_manager and hasattr(llm_manager, 'batch_process_tweets'):
             # Use LLM Manager's batch processing
             logging.info(f"🔄 Using LLM Manager batch processing for {len(tweets_data)} tweets...")
             
-            # Convert tweets to the format expected by LLM Manager
-            formatted_tweets = []
-            for tweet in tweets_data:
-                formatted_tweet = {
-                    'text': tweet.get('tweet_content', tweet.get('text', '')),
-                    'id': tweet.get('tweet_id', tweet.get('id', '')),
-                    'username': tweet.get('username', tweet.get('author', '')),
-                    'url': tweet.get('url', '')
-                }
-                formatted_tweets.append(formatted_tweet)
-            
-            # Use LLM Manager's batch processing
-            batch_results = llm_manager.batch_process_tweets(formatted_tweets)
-            
-            # Process the batch results
-            results = []
-            for i, (tweet, is_pokemon, reply) in enumerate(batch_results):
-                original_tweet_data = tweets_data[i]
-                
-                result = {
-                    'original_tweet': original_tweet_data.get('tweet_content', original_tweet_data.get('text', '')),
-                    'username': original_tweet_data.get('username', original_tweet_data.get('author', '')),
-                    'tweet_id': original_tweet_data.get('tweet_id', original_tweet_data.get('id', '')),
-                    'tweet_url': original_tweet_data.get('url', ''),
-                    'reply_content': reply if reply else "Great Pokemon content! 🔥",
-                    'success': bool(is_pokemon and reply),
-                    'is_pokemon_related': is_pokemon,
-                    'posted': False,
-                    'llm_used': True
-                }
-                
-                results.append(result)
-            
-            logging.info(f"✅ Batch processing complete: {len(results)} replies generated")
-            return results
+            batch_results = llm_manager.batch_process_tweets(_format_batch_tweets(tweets_data))
+            return _build_batch_results(tweets_data, batch_results)
             
         else:
             # Fall back to individual processing
@@ -252,6 +358,32 @@ def batch_generate_replies(tweets_data):
         # Fallback to individual processing
         return generate_replies_individually(tweets_data)
 
+async def abatch_generate_replies(tweets_data):
+    """
+    Async version of batch_generate_replies that sends the batch prompts concurrently.
+    
+    Args:
+        tweets_data: List of tweet dictionaries
+        
+    Returns:
+        List of results with generated replies
+    """
+    try:
+        llm_manager = _get_llm_manager()
+        if llm_manager and hasattr(llm_manager, 'abatch_process_tweets'):
+            logging.info(f"🔄 Using LLM Manager async batch processing for {len(tweets_data)} tweets...")
+            
+            batch_results = await llm_manager.abatch_process_tweets(_format_batch_tweets(tweets_data))
+            return _build_batch_results(tweets_data, batch_results)
+            
+        else:
+            logging.info("🔄 Falling back to individual processing...")
+            return await asyncio.to_thread(generate_replies_individually, tweets_data)
+            
+    except Exception as e:
+        logging.error(f"❌ Error in async batch reply generation: {e}")
+        return await asyncio.to_thread(generate_replies_individually, tweets_data)
+
 def generate_replies_individually(tweets_data):
     """
     Generate replies for multiple tweets individually.
@@ -321,7 +453,8 @@ def test_reply_generation():
     
     print("🧪 Testing reply generation...")
     print(f"LLM Manager Available: {LLM_MANAGER_AVAILABLE}")
-    if LLM_MANAGER_AVAILABLE and llm_manager:
+    llm_manager = _get_llm_manager()
+    if llm_manager:
         available_methods = [method for method in dir(llm_manager) if not method.startswith('_') and callable(getattr(llm_manager, method))]
         print(f"Available methods: {available_methods}")
     print("-" * 50)